@@ -11,7 +11,7 @@ import asyncio
 import platform
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field, asdict
 
 import httpx
@@ -301,6 +301,13 @@ class DataManager:
         self._security: SecurityConfig = SecurityConfig()
         self._settings: Settings = Settings()
         self._hosts: List[Host] = []
+        # Bumped on every host mutation so views can invalidate derived caches
+        self._hosts_version: int = 0
+        # (version, "added" | "updated" | "deleted" | "reset", host_id) of the last host change
+        self._last_host_change: Tuple[int, str, Optional[str]] = (0, "reset", None)
+        # id -> Host, rebuilt lazily after any host mutation
+        self._host_index: Optional[Dict[str, Host]] = None
+        self._filter_options_version: int = 0
         self._conversations: List[Conversation] = []
         self._loaded: bool = False
 
@@ -551,7 +558,9 @@ class DataManager:
 
             self._security = SecurityConfig.from_dict(data.get("security", {}))
             self._settings = Settings.from_dict(data.get("settings", {}))
+            self._filter_options_version += 1
             self._hosts = [Host.from_dict(h) for h in data.get("hosts", [])]
+            self._bump_hosts_version()
             self._conversations = [Conversation.from_dict(c) for c in data.get("conversations", [])]
             self._loaded = True
             logger.info(f"Loaded {len(self._hosts)} hosts, {len(self._conversations)} conversations")
@@ -616,6 +625,7 @@ class DataManager:
                 with open(settings_file, 'r', encoding='utf-8') as f:
                     settings_data = json.load(f)
                 self._settings = Settings.from_dict(settings_data)
+                self._filter_options_version += 1
                 logger.info("Migrated settings")
             except Exception as e:
                 logger.warning(f"Failed to migrate settings: {e}")
@@ -641,6 +651,7 @@ class DataManager:
 
                     self._hosts.append(host)
 
+                self._bump_hosts_version()
                 logger.info(f"Migrated {len(self._hosts)} hosts")
 
             except Exception as e:
@@ -766,6 +777,10 @@ class DataManager:
             self._settings.sftp_position = position
             self._save()
 
+    def filter_options_version(self) -> int:
+        """Get a counter that changes whenever tags, manufacturers, functions or groups change."""
+        return self._filter_options_version
+
     def get_tags(self) -> List[str]:
         return list(self._settings.available_tags)
 
@@ -774,11 +789,13 @@ class DataManager:
         if tag and tag not in self._settings.available_tags:
             self._settings.available_tags.append(tag)
             self._settings.available_tags.sort()
+            self._filter_options_version += 1
             self._save()
 
     def remove_tag(self, tag: str) -> None:
         if tag in self._settings.available_tags:
             self._settings.available_tags.remove(tag)
+            self._filter_options_version += 1
             self._save()
 
     def get_manufacturers(self) -> List[str]:
@@ -789,6 +806,7 @@ class DataManager:
         if value and value not in self._settings.available_manufacturers:
             self._settings.available_manufacturers.append(value)
             self._settings.available_manufacturers.sort()
+            self._filter_options_version += 1
             self._save()
 
     def get_os_versions(self) -> List[str]:
@@ -809,6 +827,7 @@ class DataManager:
         if value and value not in self._settings.available_functions:
             self._settings.available_functions.append(value)
             self._settings.available_functions.sort()
+            self._filter_options_version += 1
             self._save()
 
     def get_groups(self) -> List[str]:
@@ -819,6 +838,7 @@ class DataManager:
         if value and value not in self._settings.available_groups:
             self._settings.available_groups.append(value)
             self._settings.available_groups.sort()
+            self._filter_options_version += 1
             self._save()
 
     def get_hosts_view_mode(self) -> str:
@@ -1076,11 +1096,31 @@ class DataManager:
     def get_hosts(self) -> List[Host]:
         return self._hosts.copy()
 
+    def hosts_version(self) -> int:
+        """Get a counter that changes whenever any host is added, edited or removed."""
+        return self._hosts_version
+
+    def last_host_change(self) -> Tuple[int, str, Optional[str]]:
+        """
+        Get (version, change, host_id) for the most recent host mutation.
+
+        change is "added", "updated" or "deleted" for single-host edits, and
+        "reset" (host_id None) when the whole list was loaded or imported.
+        Lets views patch cached results when version moved by exactly one.
+        """
+        return self._last_host_change
+
+    def _bump_hosts_version(self, change: str = "reset", host_id: Optional[str] = None) -> None:
+        self._hosts_version += 1
+        self._last_host_change = (self._hosts_version, change, host_id)
+        self._host_index = None
+
     def get_host_by_id(self, host_id: str) -> Optional[Host]:
-        for host in self._hosts:
-            if host.id == host_id:
-                return host
-        return None
+        index = self._host_index
+        if index is None:
+            # Reversed so the first host wins on duplicate ids, like a linear scan
+            index = self._host_index = {h.id: h for h in reversed(self._hosts)}
+        return index.get(host_id)
 
     def add_host(
         self,
@@ -1140,6 +1180,7 @@ class DataManager:
         )
 
         self._hosts.append(new_host)
+        self._bump_hosts_version("added", new_host.id)
         self._save()
         logger.info(f"Added new host: {name} ({new_host.host})")
         return new_host
@@ -1228,6 +1269,7 @@ class DataManager:
             else:
                 existing.password_encrypted = None
 
+        self._bump_hosts_version("updated", host_id)
         self._save()
         logger.info(f"Updated host: {existing.name}")
         return existing
@@ -1237,6 +1279,7 @@ class DataManager:
         for i, host in enumerate(self._hosts):
             if host.id == host_id:
                 deleted = self._hosts.pop(i)
+                self._bump_hosts_version("deleted", host_id)
                 self._save()
                 logger.info(f"Deleted host: {deleted.name}")
                 return True
@@ -1397,6 +1440,7 @@ class DataManager:
                 for tag in imported.get("available_tags", []):
                     if tag not in self._settings.available_tags:
                         self._settings.available_tags.append(tag)
+            self._filter_options_version += 1
             result.settings_imported = True
 
         # Import hosts
@@ -1438,9 +1482,12 @@ class DataManager:
                             break
                 else:
                     self._hosts.append(host)
+                self._host_index = None
 
                 result.hosts_imported += 1
 
+            self._bump_hosts_version()
+
         self._save()
         logger.info(f"Imported data: {result.hosts_imported} hosts, settings={result.settings_imported}")
         return result
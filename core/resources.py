@@ -4,9 +4,11 @@ Works both in development (running as script) and production (compiled .exe).
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> Path:
     """Return absolute path to a resource, works in dev and compiled .exe.
 
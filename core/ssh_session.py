@@ -7,13 +7,17 @@ Designed to be reusable by the AI agent in future stages.
 import asyncio
 import logging
 import re
-from typing import Callable, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List
 from dataclasses import dataclass
 
 import asyncssh
 
 logger = logging.getLogger(__name__)
 
+# Keepalive for SSH connections, which may be shared by several tabs
+_KEEPALIVE_INTERVAL = 30
+_KEEPALIVE_COUNT_MAX = 3
+
 
 class CursorTracker:
     """
@@ -118,6 +122,18 @@ class SSHConfig:
     term_height: int = 24
 
 
+@dataclass
+class _SharedConnection:
+    """An SSH connection and the number of sessions using it."""
+    conn: asyncssh.SSHClientConnection
+    users: int = 0
+
+
+# Open connections by (host, port, username, password); another tab to the same
+# device opens a new PTY channel on the existing connection instead of a new handshake
+_connection_pool: Dict[Tuple[str, int, str, str], _SharedConnection] = {}
+
+
 class InteractiveAuthHandler:
     """
     Handler for keyboard-interactive authentication.
@@ -184,6 +200,7 @@ class SSHSession:
         self._output_callback = output_callback
         self._disconnect_callback = disconnect_callback
         self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._shared: Optional[_SharedConnection] = None
         self._process: Optional[asyncssh.SSHClientProcess] = None
         self._connected = False
         self._read_task: Optional[asyncio.Task] = None
@@ -264,31 +281,48 @@ class SSHSession:
             if not self.config.username:
                 raise ValueError("Username is required for SSH connection")
 
-            # Build connection options
-            connect_options = {
-                "host": self.config.host,
-                "port": self.config.port,
-                "username": self.config.username,
-                "known_hosts": None,  # Skip host key verification for simplicity
-            }
-
-            # Add password if provided, otherwise use keyboard-interactive for password
-            if self.config.password:
-                connect_options["password"] = self.config.password
+            pool_key = (self.config.host, self.config.port, self.config.username, self.config.password)
+            shared = _connection_pool.get(pool_key)
+            if shared and not shared.conn.is_closed():
+                try:
+                    self._process = await self._create_pty(shared.conn)
+                    logger.info("Reusing open SSH connection for new session")
+                except (asyncssh.ChannelOpenError, asyncssh.ConnectionLost) as e:
+                    # Some devices allow a single session channel per connection
+                    logger.info(f"Shared connection refused a new session ({e}), reconnecting")
+                    shared = None
             else:
-                # No password saved - use keyboard-interactive to prompt for password
-                connect_options["kbdint_auth"] = self._keyboard_interactive_auth
-
-            self._conn = await asyncssh.connect(**connect_options)
-
-            # Start interactive shell with PTY
-            logger.info(f"Creating PTY with term_type={self.config.terminal_type}")
-
-            self._process = await self._conn.create_process(
-                term_type=self.config.terminal_type,
-                term_size=(self.config.term_width, self.config.term_height),
-                encoding=None,  # Binary mode for raw terminal data
-            )
+                shared = None
+
+            if shared is None:
+                # Build connection options
+                connect_options = {
+                    "host": self.config.host,
+                    "port": self.config.port,
+                    "username": self.config.username,
+                    "known_hosts": None,  # Skip host key verification for simplicity
+                    "keepalive_interval": _KEEPALIVE_INTERVAL,
+                    "keepalive_count_max": _KEEPALIVE_COUNT_MAX,
+                }
+
+                # Add password if provided, otherwise use keyboard-interactive for password
+                if self.config.password:
+                    connect_options["password"] = self.config.password
+                else:
+                    # No password saved - use keyboard-interactive to prompt for password
+                    connect_options["kbdint_auth"] = self._keyboard_interactive_auth
+
+                self._conn = await asyncssh.connect(**connect_options)
+                self._process = await self._create_pty(self._conn)
+
+                shared = _SharedConnection(self._conn)
+                current = _connection_pool.get(pool_key)
+                if current is None or current.conn.is_closed():
+                    _connection_pool[pool_key] = shared
+
+            shared.users += 1
+            self._shared = shared
+            self._conn = shared.conn
 
             self._connected = True
 
@@ -312,6 +346,38 @@ class SSHSession:
             logger.error(f"Connection failed: {e}")
             raise
 
+    async def _create_pty(self, conn: asyncssh.SSHClientConnection) -> asyncssh.SSHClientProcess:
+        """Start an interactive shell with PTY on a connection."""
+        logger.info(f"Creating PTY with term_type={self.config.terminal_type}")
+        return await conn.create_process(
+            term_type=self.config.terminal_type,
+            term_size=(self.config.term_width, self.config.term_height),
+            encoding=None,  # Binary mode for raw terminal data
+        )
+
+    def _release_connection(self) -> bool:
+        """
+        Drop this session's use of its SSH connection.
+
+        Safe to call more than once; only the first call releases.
+
+        Returns:
+            True if the connection was closed (no other session uses it)
+        """
+        conn, self._conn = self._conn, None
+        if not conn:
+            return False
+        shared, self._shared = self._shared, None
+        if shared:
+            shared.users -= 1
+            if shared.users > 0:
+                return False
+            for key, entry in list(_connection_pool.items()):
+                if entry is shared:
+                    del _connection_pool[key]
+        conn.close()
+        return True
+
     async def _read_output(self) -> None:
         """Background task to read and forward terminal output."""
         unexpected_disconnect = False
@@ -381,6 +447,9 @@ class SSHSession:
             pass
         finally:
             self._connected = False
+            if unexpected_disconnect:
+                # Shell exited or connection lost; free the connection if no other tab uses it
+                self._release_connection()
             # Notify about unexpected disconnection
             if unexpected_disconnect and self._disconnect_callback:
                 self._disconnect_callback()
@@ -472,10 +541,9 @@ class SSHSession:
             self._process.close()
             self._process = None
 
-        if self._conn:
-            self._conn.close()
-            await self._conn.wait_closed()
-            self._conn = None
+        conn = self._conn
+        if self._release_connection():
+            await conn.wait_closed()
 
         logger.info("SSH session disconnected")
 
@@ -198,6 +198,8 @@ class ChatWidget(QWidget):
         super().__init__(parent)
 
         self._is_processing = False
+        # Processing state the action button is currently styled for
+        self._action_btn_processing: Optional[bool] = None
         self._display_messages: List[Tuple[str, bool]] = []  # Track messages for saving
         self._setup_ui()
 
@@ -452,6 +454,11 @@ class ChatWidget(QWidget):
 
     def _update_action_button(self) -> None:
         """Update action button icon and tooltip."""
+        # setStyleSheet re-polishes the button; only restyle when the mode changes
+        if self._action_btn_processing == self._is_processing:
+            return
+        self._action_btn_processing = self._is_processing
+
         if self._is_processing:
             icon = self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserStop)
             tooltip = "Parar IA"
@@ -170,6 +170,11 @@ class FieldsConfigDialog(QDialog):
         self._populate_list(self._cards_list, card_fields)
         self._populate_list(self._list_list, list_fields)
 
+    def reload_config(self) -> None:
+        """Reload the fields from settings, discarding unsaved edits (when reopened)."""
+        self._load_current_config()
+        self._tab_widget.setCurrentIndex(0)
+
     def _reset_cards(self) -> None:
         """Reset cards to default fields."""
         self._populate_list(self._cards_list, DEFAULT_CARD_FIELDS)
@@ -4,5 +4,15 @@ Host display components module.
 
 from gui.hosts.host_mixins import HostFieldMixin, HostMenuMixin
 from gui.hosts.host_filter_manager import HostFilterManager
+from gui.hosts.host_model import HostsListModel, HostsTableModel, HOST_ROLE
+from gui.hosts.host_delegate import HostCardDelegate
 
-__all__ = ["HostFieldMixin", "HostMenuMixin", "HostFilterManager"]
+__all__ = [
+    "HostFieldMixin",
+    "HostMenuMixin",
+    "HostFilterManager",
+    "HostsListModel",
+    "HostsTableModel",
+    "HOST_ROLE",
+    "HostCardDelegate",
+]
@@ -0,0 +1,193 @@
+"""
+Host Card Delegate - Paints host cards directly with QPainter.
+Draws host cards and the "Adicionar Host" card without creating child widgets.
+"""
+
+from typing import List, Optional
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionViewItem
+from PySide6.QtCore import Qt, QSize, QRect, QRectF, QModelIndex
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics, QPen, QPixmap, QPixmapCache
+
+from core.data_manager import Host
+from gui.hosts.host_mixins import HostFieldMixin
+from gui.hosts.host_model import HOST_ROLE
+
+
+CARD_WIDTH = 220
+CARD_HEIGHT = 140
+
+# Colors (same palette as the hosts view stylesheets)
+_CARD_BG = QColor("#2d2d2d")
+_CARD_BG_HOVER = QColor("#353535")
+_CARD_BORDER = QColor("#3c3c3c")
+_CARD_BORDER_HOVER = QColor("#007acc")
+_ADD_BG_HOVER = QColor(0, 122, 204, 25)
+_NAME_COLOR = QColor("#ffffff")
+_ADDRESS_COLOR = QColor("#888888")
+_FIELD_COLOR = QColor("#666666")
+_TAG_BG = QColor("#0e639c")
+_TAG_COLOR = QColor("#ffffff")
+
+_MARGIN_H = 12
+_MARGIN_V = 10
+_SPACING = 4
+_MAX_TAGS = 3
+
+
+def _font(pixel_size: int, bold: bool = False) -> QFont:
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+class HostCardDelegate(QStyledItemDelegate, HostFieldMixin):
+    """Item delegate that draws a host card for each model row."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._visible_fields: List[str] = ["name", "host", "tags", "device_type"]
+        self._name_font = _font(14, bold=True)
+        self._address_font = _font(12)
+        self._field_font = _font(11)
+        self._tag_font = _font(10)
+        self._plus_font = _font(32)
+        # Part of every QPixmapCache key; bumping it drops all cached cards
+        self._cache_generation = 0
+
+    def set_visible_fields(self, fields: Optional[List[str]]) -> None:
+        """Set which host fields are drawn on the cards."""
+        fields = fields or ["name", "host", "tags", "device_type"]
+        if fields != self._visible_fields:
+            self._visible_fields = fields
+            self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Forget cached card pixmaps (call after hosts are edited)."""
+        self._cache_generation += 1
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        host = index.data(HOST_ROLE)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        ratio = painter.device().devicePixelRatioF()
+        host_id = host.id if host is not None else "+"
+        key = f"hostcard:{self._cache_generation}:{host_id}:{int(hovered)}:{ratio}"
+
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = self._render_card(host, hovered, ratio)
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
+    def _render_card(self, host: Optional[Host], hovered: bool, ratio: float) -> QPixmap:
+        """Paint a card once into a transparent pixmap."""
+        pixmap = QPixmap(round(CARD_WIDTH * ratio), round(CARD_HEIGHT * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        rect = QRect(0, 0, CARD_WIDTH, CARD_HEIGHT)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if host is None:
+            self._paint_add_card(painter, rect, hovered)
+        else:
+            self._paint_host_card(painter, rect, host, hovered)
+        painter.end()
+        return pixmap
+
+    def _paint_host_card(self, painter: QPainter, rect: QRect, host: Host, hovered: bool) -> None:
+        """Draw background, border and the visible fields of a host."""
+        painter.setPen(QPen(_CARD_BORDER_HOVER if hovered else _CARD_BORDER, 1))
+        painter.setBrush(_CARD_BG_HOVER if hovered else _CARD_BG)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        content = rect.adjusted(_MARGIN_H, _MARGIN_V, -_MARGIN_H, -_MARGIN_V)
+        painter.setClipRect(content)
+        y = content.top()
+
+        for field in self._visible_fields:
+            if y >= content.bottom():
+                break
+
+            if field == "name":
+                y = self._draw_text(painter, content, y, host.name, self._name_font,
+                                    _NAME_COLOR, word_wrap=True)
+
+            elif field == "host":
+                y = self._draw_text(painter, content, y, self._get_field_value("host_with_port", host),
+                                    self._address_font, _ADDRESS_COLOR)
+
+            elif field == "tags":
+                if host.tags:
+                    y = self._draw_tags(painter, content, y + _SPACING, host.tags)
+
+            elif field in ("device_type", "manufacturer", "os_version", "port", "username", "functions", "groups"):
+                value = self._get_field_value(field, host)
+                if value and value != "-":
+                    y = self._draw_text(painter, content, y, value, self._field_font, _FIELD_COLOR)
+
+    def _draw_text(self, painter: QPainter, content: QRect, y: int, text: str,
+                   font: QFont, color: QColor, word_wrap: bool = False) -> int:
+        """Draw a line (or wrapped block) of text and return the next y."""
+        painter.setFont(font)
+        painter.setPen(color)
+        metrics = QFontMetrics(font)
+
+        if word_wrap:
+            flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+            bounds = metrics.boundingRect(QRect(content.left(), y, content.width(), 10000), flags, text)
+            painter.drawText(QRect(content.left(), y, content.width(), bounds.height()), flags, text)
+            return y + bounds.height() + _SPACING
+
+        elided = metrics.elidedText(text, Qt.TextElideMode.ElideRight, content.width())
+        painter.drawText(QRect(content.left(), y, content.width(), metrics.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+        return y + metrics.height() + _SPACING
+
+    def _draw_tags(self, painter: QPainter, content: QRect, y: int, tags: List[str]) -> int:
+        """Draw up to three tag chips plus a "+N" counter."""
+        painter.setFont(self._tag_font)
+        metrics = QFontMetrics(self._tag_font)
+        chip_height = metrics.height() + 4
+        x = content.left()
+
+        for tag in tags[:_MAX_TAGS]:
+            chip_width = metrics.horizontalAdvance(tag) + 12
+            chip = QRect(x, y, chip_width, chip_height)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(_TAG_BG)
+            painter.drawRoundedRect(QRectF(chip), 8, 8)
+            painter.setPen(_TAG_COLOR)
+            painter.drawText(chip, Qt.AlignmentFlag.AlignCenter, tag)
+            x += chip_width + _SPACING
+
+        if len(tags) > _MAX_TAGS:
+            painter.setPen(_ADDRESS_COLOR)
+            more = f"+{len(tags) - _MAX_TAGS}"
+            painter.drawText(QRect(x, y, metrics.horizontalAdvance(more) + 2, chip_height),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, more)
+
+        return y + chip_height + _SPACING
+
+    def _paint_add_card(self, painter: QPainter, rect: QRect, hovered: bool) -> None:
+        """Draw the dashed "Adicionar Host" card."""
+        pen = QPen(_CARD_BORDER_HOVER if hovered else _CARD_BORDER, 2, Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(_ADD_BG_HOVER if hovered else Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 8, 8)
+
+        plus_metrics = QFontMetrics(self._plus_font)
+        text_metrics = QFontMetrics(self._address_font)
+        total = plus_metrics.height() + _SPACING + text_metrics.height()
+        y = rect.top() + (rect.height() - total) // 2
+
+        painter.setPen(_ADDRESS_COLOR)
+        painter.setFont(self._plus_font)
+        painter.drawText(QRect(rect.left(), y, rect.width(), plus_metrics.height()),
+                         Qt.AlignmentFlag.AlignCenter, "+")
+        painter.setFont(self._address_font)
+        painter.drawText(QRect(rect.left(), y + plus_metrics.height() + _SPACING, rect.width(), text_metrics.height()),
+                         Qt.AlignmentFlag.AlignCenter, "Adicionar Host")
@@ -3,13 +3,82 @@ Host Filter Manager - Manages host filtering state and logic.
 Extracted from hosts_view.py for better separation of concerns.
 """
 
-from typing import List, Set, Callable, Optional
+from bisect import bisect_right
+from functools import partial
+from typing import Dict, FrozenSet, List, Set, Callable, Optional, Sequence, Tuple
 from PySide6.QtWidgets import QMenu, QPushButton
 from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QAction
 
 from core.data_manager import Host, DataManager
 
 
+_MENU_STYLE = """
+    QMenu {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 6px 24px;
+        border-radius: 2px;
+        color: #dcdcdc;
+    }
+    QMenu::item:selected {
+        background-color: #094771;
+    }
+    QMenu::item:checked {
+        background-color: #0e639c;
+    }
+    QMenu::separator {
+        height: 1px;
+        background-color: #555555;
+        margin: 4px 8px;
+    }
+"""
+
+
+def _join_blobs(blobs: Sequence[str]) -> Tuple[str, List[int]]:
+    """Join search blobs by NUL into one haystack, and get where each blob starts."""
+    offsets = []
+    pos = 0
+    for blob in blobs:
+        offsets.append(pos)
+        pos += len(blob) + 1
+    return "\0".join(blobs), offsets
+
+
+def _find_in_blobs(haystack: str, offsets: List[int], search_lower: str) -> List[int]:
+    """Get the indexes of the blobs in a haystack that contain search_lower, in order."""
+    matches = []
+    find = haystack.find
+    count = len(offsets)
+    pos = find(search_lower)
+    while pos != -1:
+        index = bisect_right(offsets, pos) - 1
+        matches.append(index)
+        # Resume at the next blob; a blob matches at most once
+        if index + 1 >= count:
+            break
+        pos = find(search_lower, offsets[index + 1])
+    return matches
+
+
+class _MenuSection:
+    """Actions of one filter submenu, kept so the menu can be updated instead of rebuilt."""
+
+    def __init__(self, menu: QMenu, label: str, selected: List[str], toggle_fn: Callable):
+        self.menu = menu
+        self.label = label
+        self.selected = selected
+        self.toggle_fn = toggle_fn
+        self.clear_action: Optional[QAction] = None
+        self.clear_separator: Optional[QAction] = None
+        self.empty_action: Optional[QAction] = None
+        self.item_actions: Dict[str, QAction] = {}
+
+
 class HostFilterManager(QObject):
     """
     Manages host filtering state and logic.
@@ -33,6 +102,28 @@ class HostFilterManager(QObject):
         self._selected_functions: List[str] = []
         self._selected_groups: List[str] = []
 
+        # Per host id caches, valid for one hosts_version:
+        # lowercased searchable text and (tags, functions, groups) sets
+        self._search_index: Dict[str, str] = {}
+        self._sets_index: Dict[str, Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]] = {}
+        self._search_index_version = -1
+
+        # Search blobs of the last filtered host list joined into one string,
+        # as (hosts, hosts_version, haystack, blob start offsets)
+        self._haystack: Optional[Tuple[List[Host], int, str, List[int]]] = None
+
+        # Filter menu options (tags, manufacturers, functions, groups),
+        # valid for one filter_options_version and set of defaults
+        self._menu_options: Optional[Tuple[List[str], List[str], List[str], List[str]]] = None
+        self._menu_options_key: Optional[tuple] = None
+
+        # Filters menu, reused across popups while the options are unchanged
+        self._filters_menu: Optional[QMenu] = None
+        self._filters_menu_options: Optional[tuple] = None
+        self._clear_all_action: Optional[QAction] = None
+        self._clear_all_separator: Optional[QAction] = None
+        self._menu_sections: List[_MenuSection] = []
+
     @property
     def total_filter_count(self) -> int:
         """Get total number of active filters."""
@@ -119,219 +210,321 @@ class HostFilterManager(QObject):
             self._selected_groups.remove(group)
         self.filters_changed.emit()
 
+    @staticmethod
+    def _build_search_blob(host: Host) -> str:
+        """Build the lowercased text matched by the search box."""
+        searchable_parts = [
+            host.id,
+            host.name,
+            host.host,
+            str(host.port),
+            host.username,
+            host.device_type or '',
+            host.manufacturer or '',
+            host.os_version or '',
+            ' '.join(host.tags),
+            ' '.join(host.functions),
+            ' '.join(host.groups),
+            host.notes or '',
+            host.created_at or '',
+        ]
+        return ' '.join(searchable_parts).lower()
+
+    def _get_search_blob(self, host: Host) -> str:
+        """Get cached search text for a host, rebuilding it after host changes."""
+        blob = self._search_index.get(host.id)
+        if blob is None:
+            blob = self._build_search_blob(host)
+            self._search_index[host.id] = blob
+        return blob
+
+    def _get_filter_sets(self, host: Host) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+        """Get cached (tags, functions, groups) sets for a host."""
+        sets = self._sets_index.get(host.id)
+        if sets is None:
+            sets = (frozenset(host.tags), frozenset(host.functions), frozenset(host.groups))
+            self._sets_index[host.id] = sets
+        return sets
+
+    def _get_haystack(self, hosts: List[Host], version: int) -> Tuple[str, List[int]]:
+        """Get the search blobs of hosts joined by NUL, and where each blob starts."""
+        cached = self._haystack
+        if cached is not None and cached[0] is hosts and cached[1] == version:
+            return cached[2], cached[3]
+
+        haystack, offsets = _join_blobs([self._get_search_blob(h) for h in hosts])
+        self._haystack = (hosts, version, haystack, offsets)
+        return haystack, offsets
+
+    def _search_hosts(self, hosts: List[Host], search_lower: str, version: int) -> List[Host]:
+        """Get hosts whose search blob contains search_lower, keeping their order."""
+        haystack, offsets = self._get_haystack(hosts, version)
+        return [hosts[i] for i in _find_in_blobs(haystack, offsets, search_lower)]
+
+    def _check_index_version(self) -> int:
+        """Drop the per host caches if hosts changed; returns the current hosts_version."""
+        version = self._data_manager.hosts_version()
+        if version != self._search_index_version:
+            self._search_index.clear()
+            self._sets_index.clear()
+            self._search_index_version = version
+        return version
+
     def apply_filters(self, hosts: List[Host], search_text: str = "") -> List[Host]:
-        """Apply all active filters to a list of hosts."""
+        """Apply all active filters to a list of hosts (returned as is, not copied, when none is active)."""
+        if not search_text and not self.total_filter_count:
+            return hosts
+
         filtered = []
         search_lower = search_text.lower() if search_text else ""
 
+        version = self._check_index_version()
+
+        # The search runs first as a few str.find calls over all blobs at once;
+        # NUL separators keep a match from spanning two hosts
+        if search_lower and "\0" not in search_lower:
+            hosts = self._search_hosts(hosts, search_lower, version)
+            search_lower = ""
+
+        selected_tags = frozenset(self._selected_tags)
+        selected_manufacturers = frozenset(self._selected_manufacturers)
+        selected_functions = frozenset(self._selected_functions)
+        selected_groups = frozenset(self._selected_groups)
+        get_sets = self._get_filter_sets
+        get_blob = self._get_search_blob
+
+        # Only active filters, cheapest and most selective first:
+        # exact manufacturer match, set subset tests, then substring search
+        predicates: List[Callable[[Host], bool]] = []
+        if selected_manufacturers:
+            # OR logic
+            predicates.append(lambda h: h.manufacturer in selected_manufacturers)
+        if selected_groups:
+            # AND logic
+            predicates.append(lambda h: selected_groups <= get_sets(h)[2])
+        if selected_functions:
+            # AND logic
+            predicates.append(lambda h: selected_functions <= get_sets(h)[1])
+        if selected_tags:
+            # AND logic
+            predicates.append(lambda h: selected_tags <= get_sets(h)[0])
+        if search_lower:
+            predicates.append(lambda h: search_lower in get_blob(h))
+
+        if not predicates:
+            return hosts
+
         for host in hosts:
-            # Search filter
-            if search_lower:
-                searchable_parts = [
-                    host.id,
-                    host.name,
-                    host.host,
-                    str(host.port),
-                    host.username,
-                    host.device_type or '',
-                    host.manufacturer or '',
-                    host.os_version or '',
-                    ' '.join(host.tags),
-                    ' '.join(host.functions),
-                    ' '.join(host.groups),
-                    host.notes or '',
-                    host.created_at or '',
-                ]
-                searchable = ' '.join(searchable_parts).lower()
-                if search_lower not in searchable:
-                    continue
-
-            # Tag filter (AND logic)
-            if self._selected_tags:
-                if not all(tag in host.tags for tag in self._selected_tags):
-                    continue
-
-            # Manufacturer filter (OR logic)
-            if self._selected_manufacturers:
-                if not host.manufacturer or host.manufacturer not in self._selected_manufacturers:
-                    continue
-
-            # Function filter (AND logic)
-            if self._selected_functions:
-                if not all(func in host.functions for func in self._selected_functions):
-                    continue
-
-            # Group filter (AND logic)
-            if self._selected_groups:
-                if not all(group in host.groups for group in self._selected_groups):
-                    continue
-
-            filtered.append(host)
+            for predicate in predicates:
+                if not predicate(host):
+                    break
+            else:
+                filtered.append(host)
 
         return filtered
 
+    def prepare_filter(self, hosts: List[Host], search_text: str = "") -> Optional[Callable[[List[int]], List[int]]]:
+        """
+        Snapshot what the active filters read from hosts, to filter them off the GUI thread.
+
+        Must be called on the GUI thread. The returned function takes indexes
+        into hosts, in any order, and returns those of the matching hosts in
+        the same order. It only reads the snapshot, never this manager or the
+        Host objects. None is returned when no filter is active.
+        """
+        if not search_text and not self.total_filter_count:
+            return None
+
+        self._check_index_version()
+        search_lower = search_text.lower()
+        selected_tags = frozenset(self._selected_tags)
+        selected_manufacturers = frozenset(self._selected_manufacturers)
+        selected_functions = frozenset(self._selected_functions)
+        selected_groups = frozenset(self._selected_groups)
+
+        blobs = [self._get_search_blob(h) for h in hosts] if search_lower else []
+        manufacturers = [h.manufacturer for h in hosts] if selected_manufacturers else []
+        sets = ([self._get_filter_sets(h) for h in hosts]
+                if selected_tags or selected_functions or selected_groups else [])
+
+        # Same order as apply_filters: search, manufacturer, then set subset tests
+        predicates: List[Callable[[int], bool]] = []
+        if selected_manufacturers:
+            predicates.append(lambda i: manufacturers[i] in selected_manufacturers)
+        if selected_groups:
+            predicates.append(lambda i: selected_groups <= sets[i][2])
+        if selected_functions:
+            predicates.append(lambda i: selected_functions <= sets[i][1])
+        if selected_tags:
+            predicates.append(lambda i: selected_tags <= sets[i][0])
+
+        def filter_indexes(indexes: List[int]) -> List[int]:
+            if search_lower and "\0" not in search_lower:
+                haystack, offsets = _join_blobs([blobs[i] for i in indexes])
+                indexes = [indexes[j] for j in _find_in_blobs(haystack, offsets, search_lower)]
+            elif search_lower:
+                indexes = [i for i in indexes if search_lower in blobs[i]]
+            if not predicates:
+                return indexes
+            return [i for i in indexes if all(predicate(i) for predicate in predicates)]
+
+        return filter_indexes
+
     @staticmethod
     def get_menu_style() -> str:
         """Get common menu stylesheet."""
-        return """
-            QMenu {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 24px;
-                border-radius: 2px;
-                color: #dcdcdc;
-            }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
-            QMenu::item:checked {
-                background-color: #0e639c;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #555555;
-                margin: 4px 8px;
-            }
-        """
+        return _MENU_STYLE
+
+    def _get_menu_options(
+        self,
+        default_manufacturers: Optional[List[str]],
+        default_functions: Optional[List[str]]
+    ) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """Get (tags, manufacturers, functions, groups) offered by the menu, merged with defaults once."""
+        key = (
+            self._data_manager.filter_options_version(),
+            tuple(default_manufacturers or ()),
+            tuple(default_functions or ()),
+        )
+        if key != self._menu_options_key:
+            # dict.fromkeys dedupes in O(n) while keeping defaults first
+            self._menu_options = (
+                self._data_manager.get_tags(),
+                list(dict.fromkeys([*(default_manufacturers or []), *self._data_manager.get_manufacturers()])),
+                list(dict.fromkeys([*(default_functions or []), *self._data_manager.get_functions()])),
+                self._data_manager.get_groups(),
+            )
+            self._menu_options_key = key
+        return self._menu_options
 
     def build_filters_menu(self, parent, default_manufacturers: List[str] = None, default_functions: List[str] = None) -> QMenu:
+        """Get the filters menu, built once; item actions are only added or removed when options change."""
+        options = self._get_menu_options(default_manufacturers, default_functions)
+        if self._filters_menu is None:
+            self._create_filters_menu(parent, *options)
+        elif options is not self._filters_menu_options:
+            for section, available in zip(self._menu_sections, options):
+                self._set_section_items(section, available)
+        self._filters_menu_options = options
+        self._sync_filters_menu()
+        return self._filters_menu
+
+    def _create_filters_menu(
+        self,
+        parent,
+        tags: List[str],
+        manufacturers: List[str],
+        functions: List[str],
+        groups: List[str]
+    ) -> None:
         """Build the complete filters menu."""
+        if self._filters_menu is not None:
+            self._filters_menu.deleteLater()
+
         menu = QMenu(parent)
         menu.setStyleSheet(self.get_menu_style())
 
-        # Clear all filters option
-        if self.total_filter_count > 0:
-            clear_action = menu.addAction("✕ Limpar todos os filtros")
-            clear_action.triggered.connect(self.clear_all)
-            menu.addSeparator()
-
-        # Tags submenu
-        tags_label = "Tags"
-        if self._selected_tags:
-            tags_label += f" ({len(self._selected_tags)})"
-        tags_menu = menu.addMenu(tags_label)
-        tags_menu.setStyleSheet(self.get_menu_style())
-        self._populate_submenu(
-            tags_menu,
-            self._data_manager.get_tags(),
-            self._selected_tags,
-            self.toggle_tag,
-            self.clear_tags
-        )
-
-        # Manufacturers submenu
-        mfg_label = "Fabricante"
-        if self._selected_manufacturers:
-            mfg_label += f" ({len(self._selected_manufacturers)})"
-        mfg_menu = menu.addMenu(mfg_label)
-        mfg_menu.setStyleSheet(self.get_menu_style())
-
-        all_manufacturers = list(default_manufacturers or [])
-        for m in self._data_manager.get_manufacturers():
-            if m not in all_manufacturers:
-                all_manufacturers.append(m)
-
-        self._populate_submenu(
-            mfg_menu,
-            all_manufacturers,
-            self._selected_manufacturers,
-            self.toggle_manufacturer,
-            self.clear_manufacturers
-        )
-
-        # Functions submenu
-        func_label = "Função"
-        if self._selected_functions:
-            func_label += f" ({len(self._selected_functions)})"
-        func_menu = menu.addMenu(func_label)
-        func_menu.setStyleSheet(self.get_menu_style())
-
-        all_functions = list(default_functions or [])
-        for f in self._data_manager.get_functions():
-            if f not in all_functions:
-                all_functions.append(f)
-
-        self._populate_submenu(
-            func_menu,
-            all_functions,
-            self._selected_functions,
-            self.toggle_function,
-            self.clear_functions
-        )
-
-        # Groups submenu
-        grp_label = "Grupos"
-        if self._selected_groups:
-            grp_label += f" ({len(self._selected_groups)})"
-        grp_menu = menu.addMenu(grp_label)
-        grp_menu.setStyleSheet(self.get_menu_style())
-        self._populate_submenu(
-            grp_menu,
-            self._data_manager.get_groups(),
-            self._selected_groups,
-            self.toggle_group,
-            self.clear_groups
-        )
-
-        return menu
+        # Clear all filters option (shown only while filters are active)
+        self._clear_all_action = menu.addAction("✕ Limpar todos os filtros")
+        self._clear_all_action.triggered.connect(self.clear_all)
+        self._clear_all_separator = menu.addSeparator()
+
+        self._menu_sections = [
+            self._populate_submenu(menu, "Tags", tags, self._selected_tags,
+                                   self.toggle_tag, self.clear_tags),
+            self._populate_submenu(menu, "Fabricante", manufacturers, self._selected_manufacturers,
+                                   self.toggle_manufacturer, self.clear_manufacturers),
+            self._populate_submenu(menu, "Função", functions, self._selected_functions,
+                                   self.toggle_function, self.clear_functions),
+            self._populate_submenu(menu, "Grupos", groups, self._selected_groups,
+                                   self.toggle_group, self.clear_groups),
+        ]
+        self._filters_menu = menu
 
     def _populate_submenu(
         self,
-        menu: QMenu,
+        parent_menu: QMenu,
+        label: str,
         available: List[str],
         selected: List[str],
         toggle_fn: Callable,
         clear_fn: Callable
-    ) -> None:
-        """Populate a filter submenu with checkable items."""
-        if not available:
-            action = menu.addAction("Nenhum disponível")
-            action.setEnabled(False)
-            return
-
-        # Clear option
-        if selected:
-            clear_action = menu.addAction("✕ Limpar")
-            clear_action.triggered.connect(clear_fn)
-            menu.addSeparator()
-
+    ) -> _MenuSection:
+        """Add a filter submenu with checkable items."""
+        menu = parent_menu.addMenu(label)
+        menu.setStyleSheet(self.get_menu_style())
+        section = _MenuSection(menu, label, selected, toggle_fn)
+
+        # Clear option (shown only while this filter is active)
+        section.clear_action = menu.addAction("✕ Limpar")
+        section.clear_action.triggered.connect(clear_fn)
+        section.clear_separator = menu.addSeparator()
+
+        section.empty_action = menu.addAction("Nenhum disponível")
+        section.empty_action.setEnabled(False)
+
+        self._set_section_items(section, available)
+        return section
+
+    def _set_section_items(self, section: _MenuSection, available: List[str]) -> None:
+        """Match a submenu's item actions to the available options, reusing existing actions."""
+        menu = section.menu
+        actions = section.item_actions
+
+        available_set = set(available)
+        for item in [item for item in actions if item not in available_set]:
+            action = actions.pop(item)
+            menu.removeAction(action)
+            action.deleteLater()
+
+        # Detach the kept actions and append them again so they follow the new order
+        for action in actions.values():
+            menu.removeAction(action)
+        new_actions: Dict[str, QAction] = {}
         for item in available:
-            action = menu.addAction(item)
-            action.setCheckable(True)
-            action.setChecked(item in selected)
-            action.triggered.connect(lambda checked, i=item: toggle_fn(i, checked))
+            action = actions.get(item)
+            if action is None:
+                action = QAction(item, menu)
+                action.setCheckable(True)
+                action.triggered.connect(partial(self._on_item_triggered, action, section.toggle_fn, item))
+            menu.addAction(action)
+            new_actions[item] = action
+        section.item_actions = new_actions
+        section.empty_action.setVisible(not available)
+
+    @staticmethod
+    def _on_item_triggered(action: QAction, toggle_fn: Callable, item: str) -> None:
+        """Apply a filter item's new check state."""
+        toggle_fn(item, action.isChecked())
+
+    def _sync_filters_menu(self) -> None:
+        """Update labels, check states and clear options to the current filters."""
+        has_filters = self.total_filter_count > 0
+        self._clear_all_action.setVisible(has_filters)
+        self._clear_all_separator.setVisible(has_filters)
+
+        for section in self._menu_sections:
+            selected = section.selected
+            section.menu.setTitle(f"{section.label} ({len(selected)})" if selected else section.label)
+            show_clear = bool(selected) and bool(section.item_actions)
+            section.clear_action.setVisible(show_clear)
+            section.clear_separator.setVisible(show_clear)
+            for item, action in section.item_actions.items():
+                action.setChecked(item in selected)
 
     def update_button_style(self, button: QPushButton) -> None:
-        """Update filter button text and style based on active filters."""
-        if self.total_filter_count > 0:
-            button.setText(f"Filtros ({self.total_filter_count})")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #0e639c;
-                    border: 1px solid #007acc;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: #1177bb;
-                }
-            """)
-        else:
-            button.setText("Filtros")
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #3c3c3c;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    color: #dcdcdc;
-                }
-                QPushButton:hover {
-                    background-color: #4c4c4c;
-                }
-            """)
+        """
+        Update filter button text and its "filtersActive" property.
+
+        The look for each state comes from a [filtersActive="true"] selector
+        in the owning view's stylesheet; the button is only re-polished when
+        the state actually changes.
+        """
+        total = self.total_filter_count
+        button.setText(f"Filtros ({total})" if total else "Filtros")
+
+        active = total > 0
+        if bool(button.property("filtersActive")) != active:
+            button.setProperty("filtersActive", active)
+            button.style().unpolish(button)
+            button.style().polish(button)
@@ -1,6 +1,6 @@
 """
 Mixins for host display components.
-Eliminates code duplication between HostCard, HostListItem, and HostsTableWidget.
+Eliminates code duplication between HostCardDelegate, HostsTableModel, HostsTableView and HostsView.
 """
 
 from typing import Optional, List
@@ -0,0 +1,249 @@
+"""
+Host Models - Qt item models backing the hosts cards and list views.
+Only the rows inside the viewport are painted, so refresh cost no longer
+grows with one QWidget (or QTableWidgetItem) per host.
+"""
+
+from typing import List, Optional, Tuple
+from PySide6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont
+
+from core.data_manager import Host
+from gui.hosts.host_mixins import HostFieldMixin
+
+
+# Custom item data role returning the Host object (None for the "add" row)
+HOST_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Table cell colors (same as the former QTableWidgetItem foregrounds)
+_TABLE_NAME_COLOR = QColor(Qt.GlobalColor.white)
+_TABLE_TAGS_COLOR = QColor(Qt.GlobalColor.cyan)
+_TABLE_FIELD_COLOR = QColor(Qt.GlobalColor.gray)
+
+# Above this many removed/inserted row ranges a model reset is cheaper
+_MAX_ROW_RANGES = 32
+
+
+def _row_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    """Group ascending row numbers into (first, last) runs of consecutive rows."""
+    ranges: List[Tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class _HostRowsMixin:
+    """
+    Row bookkeeping shared by the host models.
+
+    Requires:
+        - self._hosts: List[Host], one row per host
+    """
+
+    _hosts: List[Host]
+
+    def _last_column(self) -> int:
+        return 0
+
+    def _replace_hosts(self, hosts: List[Host]) -> None:
+        """
+        Replace the hosts shown by the model.
+
+        When the same hosts are shown again (only edited or reordered) the
+        existing rows are updated in place instead of resetting the model.
+        When hosts are only added or removed around the kept ones (a search
+        or filter change), just those rows are inserted or removed.
+        """
+        hosts = list(hosts)
+        old_ids = [h.id for h in self._hosts]
+        new_ids = [h.id for h in hosts]
+
+        if old_ids == new_ids:
+            self._hosts = hosts
+            if hosts:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(hosts) - 1, self._last_column()))
+            return
+
+        if len(old_ids) == len(new_ids) and set(old_ids) == set(new_ids):
+            self.layoutAboutToBeChanged.emit()
+            new_rows = {host_id: row for row, host_id in enumerate(new_ids)}
+            old_persistent = self.persistentIndexList()
+            new_persistent = [
+                self.index(new_rows[old_ids[index.row()]], index.column()) if index.row() < len(old_ids) else index
+                for index in old_persistent
+            ]
+            self._hosts = hosts
+            self.changePersistentIndexList(old_persistent, new_persistent)
+            self.layoutChanged.emit()
+            return
+
+        if self._apply_row_diff(old_ids, new_ids, hosts):
+            return
+
+        self.beginResetModel()
+        self._hosts = hosts
+        self.endResetModel()
+
+    def _apply_row_diff(self, old_ids: List[str], new_ids: List[str], hosts: List[Host]) -> bool:
+        """Remove and insert only the changed rows; False if a reset is needed instead."""
+        old_set = set(old_ids)
+        new_set = set(new_ids)
+        if [i for i in old_ids if i in new_set] != [i for i in new_ids if i in old_set]:
+            return False
+
+        removed = _row_ranges([row for row, i in enumerate(old_ids) if i not in new_set])
+        inserted = _row_ranges([row for row, i in enumerate(new_ids) if i not in old_set])
+        if len(removed) + len(inserted) > _MAX_ROW_RANGES:
+            return False
+
+        root = QModelIndex()
+        for first, last in reversed(removed):
+            self.beginRemoveRows(root, first, last)
+            del self._hosts[first:last + 1]
+            self.endRemoveRows()
+        # Ascending order: every row before `first` is already in place
+        for first, last in inserted:
+            self.beginInsertRows(root, first, last)
+            self._hosts[first:first] = hosts[first:last + 1]
+            self.endInsertRows()
+
+        kept_changed = any(old is not new for old, new in zip(self._hosts, hosts))
+        self._hosts = hosts
+        if kept_changed and hosts:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(hosts) - 1, self._last_column()))
+        return True
+
+
+class HostsListModel(_HostRowsMixin, QAbstractListModel):
+    """
+    List model exposing hosts to a QListView.
+
+    The last row is a synthetic "Adicionar Host" item, rendered by the
+    delegate as the dashed add card.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hosts: List[Host] = []
+
+    def set_hosts(self, hosts: List[Host]) -> None:
+        """Replace the displayed hosts."""
+        self._replace_hosts(hosts)
+
+    def hosts(self) -> List[Host]:
+        return self._hosts.copy()
+
+    def host_at(self, row: int) -> Optional[Host]:
+        """Get host at the given row (None for the add row)."""
+        if 0 <= row < len(self._hosts):
+            return self._hosts[row]
+        return None
+
+    def is_add_row(self, index: QModelIndex) -> bool:
+        """Check if index points to the synthetic add row."""
+        return index.isValid() and index.row() == len(self._hosts)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._hosts) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        host = self.host_at(index.row())
+        if role == HOST_ROLE:
+            return host
+        if role == Qt.ItemDataRole.DisplayRole:
+            return host.name if host else "Adicionar Host"
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+
+class HostsTableModel(_HostRowsMixin, HostFieldMixin, QAbstractTableModel):
+    """Table model exposing one host per row and one visible field per column."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hosts: List[Host] = []
+        self._fields: List[str] = []
+        self._labels: List[str] = []
+        self._name_font = QFont()
+        self._name_font.setBold(True)
+
+    def set_columns(self, fields: List[str], labels: List[str]) -> None:
+        """Set the visible fields and their header labels."""
+        self.beginResetModel()
+        self._fields = list(fields)
+        self._labels = list(labels)
+        self.endResetModel()
+
+    def fields(self) -> List[str]:
+        return self._fields.copy()
+
+    def set_hosts(self, hosts: List[Host]) -> None:
+        """Replace the displayed hosts."""
+        self._replace_hosts(hosts)
+
+    def _last_column(self) -> int:
+        return max(0, len(self._fields) - 1)
+
+    def host_at(self, row: int) -> Optional[Host]:
+        """Get host at the given row."""
+        if 0 <= row < len(self._hosts):
+            return self._hosts[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._hosts)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._fields)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        host = self.host_at(index.row())
+        if host is None:
+            return None
+        field = self._fields[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._get_field_value(field, host)
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if field == "name":
+                return _TABLE_NAME_COLOR
+            if field == "tags":
+                return _TABLE_TAGS_COLOR
+            return _TABLE_FIELD_COLOR
+        if role == Qt.ItemDataRole.FontRole and field == "name":
+            return self._name_font
+        if role == HOST_ROLE:
+            return host
+        if role == Qt.ItemDataRole.UserRole:
+            return host.id
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self._labels)):
+            return self._labels[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
@@ -877,34 +877,25 @@ class PasswordPromptDialog(QDialog):
         self._pass_input = QLineEdit()
         self._pass_input.setEchoMode(QLineEdit.EchoMode.Password)
         self._pass_input.setPlaceholderText("Senha")
-        self._pass_input.returnPressed.connect(self._on_ok)
         layout.addWidget(self._pass_input)
 
         # Show password checkbox
         show_pass = QCheckBox("Mostrar senha")
-        show_pass.toggled.connect(
-            lambda c: self._pass_input.setEchoMode(
-                QLineEdit.EchoMode.Normal if c else QLineEdit.EchoMode.Password
-            )
-        )
+        show_pass.toggled.connect(self._on_show_pass_toggled)
         layout.addWidget(show_pass)
 
         layout.addSpacing(10)
 
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-
-        cancel_btn = QPushButton("Cancelar")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-
-        ok_btn = QPushButton("Conectar")
-        ok_btn.clicked.connect(self._on_ok)
-        ok_btn.setDefault(True)
-        button_layout.addWidget(ok_btn)
-
-        layout.addLayout(button_layout)
+        # Buttons (Enter in the password field activates the default "Conectar")
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok |
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Conectar")
+        button_box.button(QDialogButtonBox.StandardButton.Cancel).setText("Cancelar")
+        button_box.accepted.connect(self._on_ok)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
 
         # Focus password input
         self._pass_input.setFocus()
@@ -946,6 +937,13 @@ class PasswordPromptDialog(QDialog):
             }
         """)
 
+    def _on_show_pass_toggled(self, checked: bool) -> None:
+        """Switch password echo mode, skipping the repaint if unchanged."""
+        new_mode = QLineEdit.EchoMode.Normal if checked else QLineEdit.EchoMode.Password
+        if self._pass_input.echoMode() == new_mode:
+            return
+        self._pass_input.setEchoMode(new_mode)
+
     def _on_ok(self) -> None:
         """Handle OK button click."""
         self._password = self._pass_input.text()
@@ -1008,11 +1006,7 @@ class QuickConnectDialog(QDialog):
         password_layout.addWidget(self._pass_input)
 
         show_pass = QCheckBox("Mostrar senha")
-        show_pass.toggled.connect(
-            lambda c: self._pass_input.setEchoMode(
-                QLineEdit.EchoMode.Normal if c else QLineEdit.EchoMode.Password
-            )
-        )
+        show_pass.toggled.connect(self._on_show_pass_toggled)
         password_layout.addWidget(show_pass)
         form.addRow("Senha:", password_layout)
 
@@ -1032,41 +1026,26 @@ class QuickConnectDialog(QDialog):
         self._advanced_toggle.toggled.connect(self._toggle_advanced_options)
         form.addRow("", self._advanced_toggle)
 
-        self._advanced_section = QWidget()
-        self._advanced_layout = QFormLayout()
-        self._advanced_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-        self._advanced_section.setLayout(self._advanced_layout)
-        self._advanced_section.setVisible(False)  # Hidden by default
-
-        # Terminal type (moved to advanced)
-        self._terminal_type = QComboBox()
-        self._terminal_type.addItems(["xterm", "xterm-256color", "vt100"])
-        self._terminal_type.setCurrentText("xterm")  # Default to "xterm"
-        self._advanced_layout.addRow("Tipo Terminal:", self._terminal_type)
-
-        form.addRow("", self._advanced_section)
+        # Advanced section is built on first expand (see _build_advanced_section)
+        self._form = form
+        self._advanced_section = None
+        self._terminal_type = None
 
         layout.addLayout(form)
         layout.addSpacing(15)
 
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-
-        cancel_btn = QPushButton("Cancelar")
-        cancel_btn.clicked.connect(self.reject)
+        # Buttons (Enter in any field activates the default "Conectar")
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok |
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.button(QDialogButtonBox.StandardButton.Ok).setText("Conectar")
+        cancel_btn = button_box.button(QDialogButtonBox.StandardButton.Cancel)
+        cancel_btn.setText("Cancelar")
         cancel_btn.setStyleSheet("background-color: #555555;")
-        button_layout.addWidget(cancel_btn)
-
-        connect_btn = QPushButton("Conectar")
-        connect_btn.clicked.connect(self._on_connect)
-        connect_btn.setDefault(True)
-        button_layout.addWidget(connect_btn)
-
-        layout.addLayout(button_layout)
-
-        # Enter key triggers connect
-        self._pass_input.returnPressed.connect(self._on_connect)
+        button_box.accepted.connect(self._on_connect)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
 
         # Focus host input
         self._host_input.setFocus()
@@ -1124,8 +1103,27 @@ class QuickConnectDialog(QDialog):
             }
         """)
 
+    def _build_advanced_section(self) -> None:
+        """Create the advanced options section (deferred until first expand)."""
+        self._advanced_section = QWidget()
+        self._advanced_layout = QFormLayout()
+        self._advanced_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        self._advanced_section.setLayout(self._advanced_layout)
+
+        # Terminal type (moved to advanced)
+        self._terminal_type = QComboBox()
+        self._terminal_type.addItems(["xterm", "xterm-256color", "vt100"])
+        self._terminal_type.setCurrentText("xterm")  # Default to "xterm"
+        self._advanced_layout.addRow("Tipo Terminal:", self._terminal_type)
+
+        self._form.addRow("", self._advanced_section)
+
     def _toggle_advanced_options(self, checked: bool) -> None:
         """Toggle advanced options visibility."""
+        if self._advanced_section is None:
+            if not checked:
+                return
+            self._build_advanced_section()
         self._advanced_section.setVisible(checked)
         if checked:
             self._advanced_toggle.setText("▼ Opções Avançadas")
@@ -1134,6 +1132,13 @@ class QuickConnectDialog(QDialog):
         # Adjust dialog size after toggling section
         self.adjustSize()
 
+    def _on_show_pass_toggled(self, checked: bool) -> None:
+        """Switch password echo mode, skipping the repaint if unchanged."""
+        new_mode = QLineEdit.EchoMode.Normal if checked else QLineEdit.EchoMode.Password
+        if self._pass_input.echoMode() == new_mode:
+            return
+        self._pass_input.setEchoMode(new_mode)
+
     def _on_connect(self) -> None:
         """Handle connect button click."""
         host = self._host_input.text().strip()
@@ -1156,7 +1161,7 @@ class QuickConnectDialog(QDialog):
             "port": self._port_input.value(),
             "username": username,
             "password": self._pass_input.text(),
-            "terminal_type": self._terminal_type.currentText(),
+            "terminal_type": self._terminal_type.currentText() if self._terminal_type else "xterm",
             "device_type": device_type if device_type else None
         }
         self.accept()
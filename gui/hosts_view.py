@@ -3,29 +3,216 @@ Hosts view widget for displaying all hosts in card or list format.
 Refactored to use HostFilterManager for filter logic.
 """
 
-from typing import Optional
+from bisect import insort
+from collections import OrderedDict
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox,
-    QPushButton, QScrollArea, QFrame, QGridLayout
+    QPushButton, QFrame, QListView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QModelIndex, QTimer, QThread, QSignalBlocker
+from PySide6.QtGui import QPixmapCache
 
 from core.data_manager import DataManager, Host
-from gui.host_card import HostCard, AddHostCard, HostsTableWidget
+from gui.host_card import HostsTableView
 from gui.fields_config_dialog import FieldsConfigDialog
+from gui.hosts_dialog import DEFAULT_MANUFACTURERS, DEFAULT_FUNCTIONS
 from gui.hosts.host_filter_manager import HostFilterManager
+from gui.hosts.host_mixins import HostMenuMixin
+from gui.hosts.host_model import HostsListModel, HOST_ROLE
+from gui.hosts.host_delegate import HostCardDelegate, CARD_WIDTH
+
+CARD_SPACING = 16
+
+# Above this many hosts, filtering and sorting run in a HostFilterWorker
+_ASYNC_FILTER_MIN_HOSTS = 2000
+
+# Number of recent filtered+sorted host lists kept for backspacing and re-typing
+_DISPLAY_CACHE_SIZE = 8
+
+# Sort dropdown entries as (label, field), in display order
+_SORT_OPTIONS = (
+    ("Nome", "name"),
+    ("IP/Host", "host"),
+    ("Porta", "port"),
+    ("Usuario", "username"),
+    ("Tipo", "device_type"),
+    ("Fabricante", "manufacturer"),
+    ("OS/Versao", "os_version"),
+)
+_SORT_INDEX_MAP = {field: index for index, (_, field) in enumerate(_SORT_OPTIONS)}
+
+# Sort fields compared case-insensitively; missing values (other than name) sort last
+_LOWERCASE_SORT_FIELDS = ("name", "username", "device_type", "manufacturer", "os_version")
+
+# Whole hosts view stylesheet, applied once on HostsView and matched by object
+# name, so child widgets do not each parse and polish their own stylesheet.
+_HOSTS_VIEW_STYLE = """
+    QWidget {
+        background-color: #1e1e1e;
+    }
+
+    QFrame#hostsToolbar {
+        background-color: #252526;
+        border-bottom: 1px solid #3c3c3c;
+    }
+
+    QLineEdit#hostsSearch {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px 12px;
+        color: #dcdcdc;
+        font-size: 13px;
+    }
+    QLineEdit#hostsSearch:focus {
+        border-color: #007acc;
+    }
+
+    QPushButton#hostsFiltersBtn, QPushButton#hostsToolbarBtn {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: #dcdcdc;
+    }
+    QPushButton#hostsFiltersBtn:hover, QPushButton#hostsToolbarBtn:hover {
+        background-color: #4c4c4c;
+    }
+    QPushButton#hostsFiltersBtn::menu-indicator {
+        image: none;
+    }
+    QPushButton#hostsFiltersBtn[filtersActive="true"] {
+        background-color: #0e639c;
+        border: 1px solid #007acc;
+        color: white;
+    }
+    QPushButton#hostsFiltersBtn[filtersActive="true"]:hover {
+        background-color: #1177bb;
+    }
+
+    QComboBox#hostsSortCombo {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px 12px;
+        color: #dcdcdc;
+        min-width: 100px;
+    }
+    QComboBox#hostsSortCombo:hover {
+        background-color: #4c4c4c;
+    }
+    QComboBox#hostsSortCombo::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox#hostsSortCombo::down-arrow {
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #dcdcdc;
+    }
+    QComboBox#hostsSortCombo QAbstractItemView {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        color: #dcdcdc;
+        selection-background-color: #007acc;
+    }
+
+    QPushButton#hostsToggleBtn {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px;
+        color: #dcdcdc;
+        font-size: 16px;
+        min-width: 36px;
+    }
+    QPushButton#hostsToggleBtn:hover {
+        background-color: #4c4c4c;
+    }
+    QPushButton#hostsToggleBtn:checked {
+        background-color: #007acc;
+        border-color: #007acc;
+    }
+
+    QPushButton#hostsAddRowBtn {
+        background-color: transparent;
+        border: none;
+        padding: 16px;
+        color: #888888;
+        font-size: 13px;
+        text-align: left;
+    }
+    QPushButton#hostsAddRowBtn:hover {
+        background-color: #2d2d2d;
+        color: #007acc;
+    }
+
+    QListView#hostsCards, QWidget#hostsList {
+        background-color: #1e1e1e;
+        border: none;
+    }
+    QListView#hostsCards QScrollBar:vertical {
+        background-color: #2d2d2d;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QListView#hostsCards QScrollBar::handle:vertical {
+        background-color: #555555;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QListView#hostsCards QScrollBar::handle:vertical:hover {
+        background-color: #666666;
+    }
+    QListView#hostsCards QScrollBar::add-line:vertical, QListView#hostsCards QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
 
 
-class FlowLayout(QGridLayout):
-    """Grid layout that arranges items in a flow."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setSpacing(16)
-        self.setContentsMargins(16, 16, 16, 16)
+class HostFilterWorker(QThread):
+    """
+    Thread to sort and filter a snapshot of hosts off the GUI thread.
+
+    Sort keys and filter data are read from the hosts on the GUI thread
+    beforehand; the thread only reorders and picks list items, so it never
+    touches a Host or a cache the GUI thread also uses.
+    """
+
+    # generation, cache key, all hosts sorted (None if not sorted here), filtered hosts
+    hosts_ready = Signal(int, tuple, object, list)
+
+    def __init__(self, generation: int, cache_key: tuple, hosts: List[Host],
+                 sort_values: Optional[list],
+                 filter_indexes: Optional[Callable[[List[int]], List[int]]]):
+        super().__init__()
+        self._generation = generation
+        self._cache_key = cache_key
+        self._hosts = hosts
+        self._sort_values = sort_values
+        self._filter_indexes = filter_indexes
+
+    def run(self):
+        """Sort and filter the host snapshot (skipped or dropped once superseded)."""
+        if self.isInterruptionRequested():
+            return
+        hosts, indexes = self._hosts, list(range(len(self._hosts)))
+        sorted_hosts = None
+        if self._sort_values is not None:
+            indexes.sort(key=self._sort_values.__getitem__)
+            sorted_hosts = [hosts[i] for i in indexes]
+        if self._filter_indexes is not None:
+            result = [hosts[i] for i in self._filter_indexes(indexes)]
+        else:
+            result = sorted_hosts if sorted_hosts is not None else hosts
+        if not self.isInterruptionRequested():
+            self.hosts_ready.emit(self._generation, self._cache_key, sorted_hosts, result)
 
 
-class HostsView(QWidget):
+class HostsView(QWidget, HostMenuMixin):
     """Main view for displaying and managing hosts."""
 
     connect_requested = Signal(str, str)  # host_id, ip (empty for fallback)
@@ -42,68 +229,132 @@ class HostsView(QWidget):
         self._view_mode = self._data_manager.get_hosts_view_mode()
         self._sort_by = self._data_manager.get_hosts_sort_by()
         self._search_text = ""
-        self._host_widgets: list = []
-        self._table_widget: Optional[HostsTableWidget] = None
+
+        # Recent filtered+sorted host lists by ((filters, sort, hosts_version),
+        # search text), least recently used first
+        self._display_cache: "OrderedDict[tuple, list]" = OrderedDict()
+
+        # Copy of DataManager's hosts as (hosts_version, hosts), shared by every
+        # refresh until a host changes
+        self._hosts_snapshot: Tuple[int, list] = (-1, [])
+
+        # All hosts in sort order as ((sort_by, hosts_version), hosts); filtering
+        # keeps order, so typing a search never re-sorts
+        self._sorted_cache: Tuple[Optional[tuple], list] = (None, [])
+
+        # Background filtering: results from older generations are discarded
+        self._filter_gen = 0
+        self._filter_workers: List[HostFilterWorker] = []
+
+        # Casefolded sort keys per field and host id, valid for one hosts_version
+        self._sort_keys: Dict[str, Dict[str, str]] = {}
+        self._sort_keys_version = -1
+
+        # hosts_version the cached card pixmaps were rendered for
+        self._card_cache_version = -1
+
+        # Number of card columns the cards view was last laid out for
+        self._current_cols = 0
+
+        # Fields dialog, created on first use and reloaded on every open
+        self._fields_dialog: Optional[FieldsConfigDialog] = None
+
+        # Open batch_refresh() blocks, and whether a refresh was deferred by them
+        self._refresh_suppressed = 0
+        self._refresh_deferred = False
 
         # Filter manager
         self._filter_manager = HostFilterManager(data_manager, self)
         self._filter_manager.filters_changed.connect(self._on_filters_changed)
 
-        self._setup_ui()
-        self._apply_style()
-        self.refresh()
+        # Room for a few screens of rendered host cards (KB)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20 * 1024))
+
+        with self.batch_refresh():
+            self._setup_ui()
+            self._apply_style()
+            self.refresh()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        # Coalesces search keystrokes and filter toggles into a single refresh
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.refresh)
+
+        # Relayouts cards at most once per 50 ms while the window is resized
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._relayout_cards)
+
         # Toolbar
         toolbar = self._create_toolbar()
         layout.addWidget(toolbar)
 
-        # Hosts area (scrollable)
-        self._scroll_area = QScrollArea()
-        self._scroll_area.setWidgetResizable(True)
-        self._scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #666666;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-
-        self._hosts_container = QWidget()
-        self._hosts_container.setStyleSheet("background-color: #1e1e1e;")
-        self._hosts_layout = FlowLayout(self._hosts_container)
-        self._scroll_area.setWidget(self._hosts_container)
-
-        layout.addWidget(self._scroll_area)
+        # Cards view (only visible cards are painted by the delegate)
+        self._cards_model = HostsListModel(self)
+        self._card_delegate = HostCardDelegate(self)
+        self._cards_view = QListView()
+        self._cards_view.setModel(self._cards_model)
+        self._cards_view.setItemDelegate(self._card_delegate)
+        self._cards_view.setViewMode(QListView.ViewMode.IconMode)
+        self._cards_view.setFlow(QListView.Flow.LeftToRight)
+        self._cards_view.setWrapping(True)
+        self._cards_view.setResizeMode(QListView.ResizeMode.Fixed)
+        self._cards_view.setMovement(QListView.Movement.Static)
+        self._cards_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self._cards_view.setBatchSize(200)
+        self._cards_view.setUniformItemSizes(True)
+        self._cards_view.setSpacing(CARD_SPACING)
+        self._cards_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self._cards_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._cards_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self._cards_view.setMouseTracking(True)
+        self._cards_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self._cards_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self._cards_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._cards_view.customContextMenuRequested.connect(self._show_card_context_menu)
+        self._cards_view.clicked.connect(self._on_card_clicked)
+        self._cards_view.doubleClicked.connect(self._on_card_double_clicked)
+        self._cards_view.setObjectName("hostsCards")
+        layout.addWidget(self._cards_view)
+
+        # List area: the table scrolls its own viewport, the add button stays below it
+        self._list_container = QWidget()
+        self._list_container.setObjectName("hostsList")
+        self._list_container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        list_layout = QVBoxLayout(self._list_container)
+        list_layout.setSpacing(0)
+        list_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Table and "Add Host" button are created once and refilled on refresh
+        self._table_widget = HostsTableView(
+            visible_fields=self._data_manager.get_list_visible_fields(),
+            column_widths=self._data_manager.get_list_column_widths()
+        )
+        self._table_widget.connect_requested.connect(self.connect_requested.emit)
+        self._table_widget.edit_requested.connect(self.edit_requested.emit)
+        self._table_widget.delete_requested.connect(self.delete_requested.emit)
+        self._table_widget.winbox_requested.connect(self.winbox_requested.emit)
+        self._table_widget.web_access_requested.connect(self.web_access_requested.emit)
+        self._table_widget.column_width_changed.connect(self._on_column_resized)
+        list_layout.addWidget(self._table_widget, 1)
+
+        add_btn = QPushButton("+ Adicionar Host")
+        add_btn.setObjectName("hostsAddRowBtn")
+        add_btn.clicked.connect(self.add_requested.emit)
+        list_layout.addWidget(add_btn)
+
+        layout.addWidget(self._list_container)
 
     def _create_toolbar(self) -> QFrame:
         toolbar = QFrame()
-        toolbar.setStyleSheet("""
-            QFrame {
-                background-color: #252526;
-                border-bottom: 1px solid #3c3c3c;
-            }
-        """)
+        toolbar.setObjectName("hostsToolbar")
 
         layout = QHBoxLayout(toolbar)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -115,101 +366,31 @@ class HostsView(QWidget):
         self._search_input.setClearButtonEnabled(True)
         self._search_input.setMinimumWidth(200)
         self._search_input.setMaximumWidth(400)
-        self._search_input.textChanged.connect(self._on_search_changed)
-        self._search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 12px;
-                color: #dcdcdc;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: #007acc;
-            }
-        """)
+        # textEdited (also sent by the clear button) skips programmatic text changes
+        self._search_input.textEdited.connect(self._on_search_changed)
+        self._search_input.setObjectName("hostsSearch")
         layout.addWidget(self._search_input)
 
         # Filters button
         self._filters_btn = QPushButton("Filtros")
-        self._filters_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #dcdcdc;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-            QPushButton::menu-indicator {
-                image: none;
-            }
-        """)
+        self._filters_btn.setObjectName("hostsFiltersBtn")
         self._filters_btn.clicked.connect(self._show_filters_menu)
         layout.addWidget(self._filters_btn)
 
         # Sort dropdown
         self._sort_combo = QComboBox()
-        self._sort_combo.addItem("Nome", "name")
-        self._sort_combo.addItem("IP/Host", "host")
-        self._sort_combo.addItem("Porta", "port")
-        self._sort_combo.addItem("Usuario", "username")
-        self._sort_combo.addItem("Tipo", "device_type")
-        self._sort_combo.addItem("Fabricante", "manufacturer")
-        self._sort_combo.addItem("OS/Versao", "os_version")
-        sort_index_map = {"name": 0, "host": 1, "port": 2, "username": 3,
-                         "device_type": 4, "manufacturer": 5, "os_version": 6}
-        self._sort_combo.setCurrentIndex(sort_index_map.get(self._sort_by, 0))
+        for label, field in _SORT_OPTIONS:
+            self._sort_combo.addItem(label, field)
+        self._sort_combo.setCurrentIndex(_SORT_INDEX_MAP.get(self._sort_by, 0))
         self._sort_combo.currentIndexChanged.connect(self._on_sort_changed)
-        self._sort_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 12px;
-                color: #dcdcdc;
-                min-width: 100px;
-            }
-            QComboBox:hover {
-                background-color: #4c4c4c;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #dcdcdc;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                color: #dcdcdc;
-                selection-background-color: #007acc;
-            }
-        """)
+        self._sort_combo.setObjectName("hostsSortCombo")
         layout.addWidget(self._sort_combo)
 
         layout.addStretch()
 
         # Quick connect button
         quick_btn = QPushButton("Conexao Rapida")
-        quick_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #dcdcdc;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-        """)
+        quick_btn.setObjectName("hostsToolbarBtn")
         quick_btn.clicked.connect(self.quick_connect_requested.emit)
         layout.addWidget(quick_btn)
 
@@ -218,7 +399,7 @@ class HostsView(QWidget):
         self._fields_btn.setToolTip("Configurar campos visiveis")
         self._fields_btn.setText("☰")
         self._fields_btn.clicked.connect(self._show_fields_config)
-        self._fields_btn.setStyleSheet(self._get_toggle_btn_style())
+        self._fields_btn.setObjectName("hostsToggleBtn")
         layout.addWidget(self._fields_btn)
 
         # View mode toggle buttons
@@ -228,7 +409,7 @@ class HostsView(QWidget):
         self._cards_btn.setCheckable(True)
         self._cards_btn.setChecked(self._view_mode == "cards")
         self._cards_btn.clicked.connect(lambda: self._set_view_mode("cards"))
-        self._cards_btn.setStyleSheet(self._get_toggle_btn_style())
+        self._cards_btn.setObjectName("hostsToggleBtn")
         layout.addWidget(self._cards_btn)
 
         self._list_btn = QPushButton()
@@ -237,42 +418,35 @@ class HostsView(QWidget):
         self._list_btn.setCheckable(True)
         self._list_btn.setChecked(self._view_mode == "list")
         self._list_btn.clicked.connect(lambda: self._set_view_mode("list"))
-        self._list_btn.setStyleSheet(self._get_toggle_btn_style())
+        self._list_btn.setObjectName("hostsToggleBtn")
         layout.addWidget(self._list_btn)
 
         return toolbar
 
-    def _get_toggle_btn_style(self) -> str:
-        return """
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px;
-                color: #dcdcdc;
-                font-size: 16px;
-                min-width: 36px;
-            }
-            QPushButton:hover {
-                background-color: #4c4c4c;
-            }
-            QPushButton:checked {
-                background-color: #007acc;
-                border-color: #007acc;
-            }
-        """
-
     def _apply_style(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-            }
-        """)
+        self.setStyleSheet(_HOSTS_VIEW_STYLE)
+
+    def _show_card_context_menu(self, pos):
+        """Show host context menu for the card under the cursor."""
+        host = self._cards_view.indexAt(pos).data(HOST_ROLE)
+        if host is None:
+            return
+        menu = self._build_context_menu(self, host)
+        menu.exec(self._cards_view.viewport().mapToGlobal(pos))
+
+    def _on_card_clicked(self, index: QModelIndex):
+        """Handle click on a card (the add card opens the host dialog)."""
+        if self._cards_model.is_add_row(index):
+            self.add_requested.emit()
+
+    def _on_card_double_clicked(self, index: QModelIndex):
+        """Handle double click on a host card to connect."""
+        host = index.data(HOST_ROLE)
+        if host is not None:
+            self.connect_requested.emit(host.id, "")
 
     def _show_filters_menu(self):
         """Show the filters menu using HostFilterManager."""
-        from gui.hosts_dialog import DEFAULT_MANUFACTURERS, DEFAULT_FUNCTIONS
-
         menu = self._filter_manager.build_filters_menu(
             self,
             default_manufacturers=DEFAULT_MANUFACTURERS,
@@ -283,12 +457,16 @@ class HostsView(QWidget):
     def _on_filters_changed(self):
         """Handle filter changes from the filter manager."""
         self._filter_manager.update_button_style(self._filters_btn)
-        self.refresh()
+        self._search_timer.start()
 
     def _on_search_changed(self, text: str):
-        """Handle search text change."""
-        self._search_text = text.strip().lower()
-        self.refresh()
+        """Handle search text change (refresh runs once typing pauses)."""
+        search_text = text.strip().lower()
+        if search_text == self._search_text:
+            # Only case or surrounding whitespace changed; the results are the same
+            return
+        self._search_text = search_text
+        self._search_timer.start()
 
     def _on_sort_changed(self, index: int):
         """Handle sort selection change."""
@@ -298,152 +476,298 @@ class HostsView(QWidget):
 
     def _set_view_mode(self, mode: str):
         """Set the view mode (cards or list)."""
+        # Clicking the already checked button unchecks it; restore the state
+        # without signals and skip the refresh when the mode is unchanged
+        with QSignalBlocker(self._cards_btn), QSignalBlocker(self._list_btn):
+            self._cards_btn.setChecked(mode == "cards")
+            self._list_btn.setChecked(mode == "list")
+        if mode == self._view_mode:
+            return
         self._view_mode = mode
         self._data_manager.set_hosts_view_mode(mode)
-        self._cards_btn.setChecked(mode == "cards")
-        self._list_btn.setChecked(mode == "list")
         self.refresh()
 
     def _show_fields_config(self):
         """Show the fields configuration dialog."""
-        dialog = FieldsConfigDialog(self._data_manager, self)
-        if dialog.exec():
+        if self._fields_dialog is None:
+            self._fields_dialog = FieldsConfigDialog(self._data_manager, self)
+        else:
+            self._fields_dialog.reload_config()
+        if self._fields_dialog.exec():
             self.refresh()
 
     def _on_column_resized(self, field: str, width: int):
         """Handle column resize from table widget."""
         self._data_manager.set_list_column_width(field, width)
 
-    def _sort_hosts(self, hosts: list) -> list:
-        """Sort hosts based on current sort setting."""
-        if self._sort_by == "name":
-            return sorted(hosts, key=lambda h: h.name.lower())
-        elif self._sort_by == "host":
-            return sorted(hosts, key=lambda h: h.host)
-        elif self._sort_by == "port":
-            return sorted(hosts, key=lambda h: h.port)
-        elif self._sort_by == "username":
-            return sorted(hosts, key=lambda h: (h.username or "zzz").lower())
-        elif self._sort_by == "device_type":
-            return sorted(hosts, key=lambda h: (h.device_type or "zzz").lower())
-        elif self._sort_by == "manufacturer":
-            return sorted(hosts, key=lambda h: (h.manufacturer or "zzz").lower())
-        elif self._sort_by == "os_version":
-            return sorted(hosts, key=lambda h: (h.os_version or "zzz").lower())
+    def _single_host_change(self, since_version: int, version: int) -> Optional[Tuple[str, str]]:
+        """Get (change, host_id) if version is exactly one single-host edit after since_version."""
+        change_version, change, host_id = self._data_manager.last_host_change()
+        if version == since_version + 1 and change_version == version and host_id is not None:
+            return change, host_id
+        return None
+
+    def _get_sort_keys(self, field: str, hosts: list) -> Dict[str, str]:
+        """Get casefolded sort keys by host id, computed once per host and hosts_version."""
+        version = self._data_manager.hosts_version()
+        if version != self._sort_keys_version:
+            single = self._single_host_change(self._sort_keys_version, version)
+            if single is not None:
+                for keys in self._sort_keys.values():
+                    keys.pop(single[1], None)
+            else:
+                self._sort_keys.clear()
+            self._sort_keys_version = version
+
+        keys = self._sort_keys.setdefault(field, {})
+        get_value = attrgetter(field)
+        missing = "" if field == "name" else "zzz"
+        for h in hosts:
+            if h.id not in keys:
+                keys[h.id] = (get_value(h) or missing).casefold()
+        return keys
+
+    def _get_sorted_hosts(self, hosts: list, sort_by: str, version: int) -> list:
+        """Get all hosts sorted, sorting only when the sort field or hosts_version changed."""
+        sorted_hosts = self._reuse_sorted_hosts(hosts, sort_by, version)
+        if sorted_hosts is None:
+            sorted_hosts = self._sort_hosts(hosts, sort_by)
+            self._sorted_cache = ((sort_by, version), sorted_hosts)
+        return sorted_hosts
+
+    def _reuse_sorted_hosts(self, hosts: list, sort_by: str, version: int) -> Optional[list]:
+        """
+        Get all hosts sorted from the last sort; None if a full sort is needed.
+
+        A single added, edited or deleted host is moved into place with
+        bisect instead of re-sorting the whole list.
+        """
+        key, sorted_hosts = self._sorted_cache
+        if key == (sort_by, version):
+            return sorted_hosts
+        if key is None or key[0] != sort_by:
+            return None
+
+        single = self._single_host_change(key[1], version)
+        if single is None:
+            return None
+        patched = self._patch_sorted_hosts(sorted_hosts, hosts, sort_by, *single)
+        if patched is not None:
+            self._sorted_cache = ((sort_by, version), patched)
+        return patched
+
+    def _patch_sorted_hosts(self, sorted_hosts: list, hosts: list, sort_by: str,
+                            change: str, host_id: str) -> Optional[list]:
+        """Apply one host change to a sorted list; None if a full sort is needed."""
+        if sort_by in _LOWERCASE_SORT_FIELDS:
+            keys = self._get_sort_keys(sort_by, hosts)
+            sort_key = lambda h: keys[h.id]
+        elif sort_by in ("host", "port"):
+            sort_key = attrgetter(sort_by)
+        else:
+            return None
+
+        patched = [h for h in sorted_hosts if h.id != host_id]
+        if change in ("added", "updated"):
+            host = next((h for h in reversed(hosts) if h.id == host_id), None)
+            if host is None:
+                return None
+            insort(patched, host, key=sort_key)
+        return patched
+
+    def _sort_hosts(self, hosts: list, sort_by: Optional[str] = None) -> list:
+        """Sort hosts by the given field (defaults to the current sort setting)."""
+        sort_by = sort_by or self._sort_by
+        if sort_by in _LOWERCASE_SORT_FIELDS:
+            keys = self._get_sort_keys(sort_by, hosts)
+            return sorted(hosts, key=lambda h: keys[h.id])
+        elif sort_by in ("host", "port"):
+            return sorted(hosts, key=attrgetter(sort_by))
         return hosts
 
+    def _get_sort_values(self, hosts: list, sort_by: str) -> Optional[list]:
+        """Get the sort key of each host, in list order; None if sort_by keeps the order."""
+        if sort_by in _LOWERCASE_SORT_FIELDS:
+            keys = self._get_sort_keys(sort_by, hosts)
+            return [keys[h.id] for h in hosts]
+        elif sort_by in ("host", "port"):
+            return list(map(attrgetter(sort_by), hosts))
+        return None
+
+    def _get_hosts_snapshot(self, version: int) -> list:
+        """Get a copy of all hosts, copied again only after hosts_version changed."""
+        if self._hosts_snapshot[0] != version:
+            self._hosts_snapshot = (version, self._data_manager.get_hosts())
+        return self._hosts_snapshot[1]
+
+    def _find_prefix_result(self, state: tuple, search_text: str) -> Optional[list]:
+        """Get the cached result for the longest shorter search that search_text extends."""
+        best_text, best_hosts = None, None
+        for (cached_state, cached_text), hosts in self._display_cache.items():
+            if (cached_state == state and search_text.startswith(cached_text)
+                    and (best_text is None or len(cached_text) > len(best_text))):
+                best_text, best_hosts = cached_text, hosts
+        return best_hosts
+
+    def _store_display_hosts(self, key: tuple, hosts: list) -> None:
+        """Remember a filtered+sorted host list, dropping the least recently used ones."""
+        self._display_cache[key] = hosts
+        self._display_cache.move_to_end(key)
+        while len(self._display_cache) > _DISPLAY_CACHE_SIZE:
+            self._display_cache.popitem(last=False)
+
+    def _get_display_hosts(self) -> Optional[list]:
+        """
+        Get filtered and sorted hosts, reusing the last result if nothing changed.
+
+        Large host lists are filtered by a HostFilterWorker instead; None is
+        returned and the view is refreshed when the worker delivers.
+        """
+        fm = self._filter_manager
+        search_text, sort_by = self._search_text, self._sort_by
+        version = self._data_manager.hosts_version()
+        state = (
+            tuple(fm.selected_tags),
+            tuple(fm.selected_manufacturers),
+            tuple(fm.selected_functions),
+            tuple(fm.selected_groups),
+            sort_by,
+            version,
+        )
+        key = (state, search_text)
+
+        # Any refresh supersedes filters still running in the background
+        self._filter_gen += 1
+        for running in self._filter_workers:
+            running.requestInterruption()
+
+        cached = self._display_cache.get(key)
+        if cached is not None:
+            self._display_cache.move_to_end(key)
+            return cached
+
+        # A longer search only narrows an earlier result for a prefix of it,
+        # and filtering keeps the order, so that result can be filtered again
+        narrower = self._find_prefix_result(state, search_text)
+        hosts = narrower if narrower is not None else self._get_hosts_snapshot(version)
+
+        if len(hosts) < _ASYNC_FILTER_MIN_HOSTS:
+            if narrower is None:
+                hosts = self._get_sorted_hosts(hosts, sort_by, version)
+            result = fm.apply_filters(hosts, search_text)
+            self._store_display_hosts(key, result)
+            return result
+
+        # Everything the worker needs is read from the hosts here, on the GUI thread
+        sort_values = None
+        if narrower is None:
+            sorted_hosts = self._reuse_sorted_hosts(hosts, sort_by, version)
+            if sorted_hosts is not None:
+                hosts = sorted_hosts
+            else:
+                sort_values = self._get_sort_values(hosts, sort_by)
+        filter_indexes = fm.prepare_filter(hosts, search_text)
+
+        worker = HostFilterWorker(self._filter_gen, key, hosts, sort_values, filter_indexes)
+        worker.hosts_ready.connect(self._on_hosts_filtered)
+        worker.finished.connect(lambda: self._on_filter_worker_finished(worker))
+        self._filter_workers.append(worker)
+        worker.start()
+        return None
+
+    def _on_hosts_filtered(self, generation: int, key: tuple, sorted_hosts: Optional[list], hosts: list):
+        """Keep the result of a background filter, and show it unless it was superseded."""
+        state = key[0]
+        sort_by, version = state[-2], state[-1]
+        if version == self._data_manager.hosts_version():
+            if sorted_hosts is not None:
+                self._sorted_cache = ((sort_by, version), sorted_hosts)
+            self._store_display_hosts(key, hosts)
+        if generation == self._filter_gen:
+            self._show_hosts(hosts)
+
+    def stop_filter_workers(self) -> None:
+        """Interrupt background filters and wait for them (the threads must not outlive the view)."""
+        for worker in self._filter_workers:
+            worker.requestInterruption()
+        for worker in self._filter_workers:
+            worker.wait()
+
+    def _on_filter_worker_finished(self, worker: HostFilterWorker):
+        """Release a finished filter worker."""
+        if worker in self._filter_workers:
+            self._filter_workers.remove(worker)
+        worker.deleteLater()
+
+    @contextmanager
+    def batch_refresh(self) -> Iterator[None]:
+        """Defer refresh() calls made inside the block to a single refresh when it ends."""
+        self._refresh_suppressed += 1
+        try:
+            yield
+        finally:
+            self._refresh_suppressed -= 1
+            if self._refresh_suppressed == 0 and self._refresh_deferred:
+                self._refresh_deferred = False
+                self.refresh()
+
     def refresh(self):
         """Refresh the hosts display."""
-        # Clear existing widgets
-        for widget in self._host_widgets:
-            widget.deleteLater()
-        self._host_widgets.clear()
-
-        # Clear layout
-        while self._hosts_layout.count():
-            item = self._hosts_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Get hosts and apply filters
-        hosts = self._data_manager.get_hosts()
-        hosts = self._filter_manager.apply_filters(hosts, self._search_text)
-        hosts = self._sort_hosts(hosts)
+        if self._refresh_suppressed:
+            self._refresh_deferred = True
+            return
+        hosts = self._get_display_hosts()
+        if hosts is not None:
+            self._show_hosts(hosts)
+
+    def _show_hosts(self, hosts: list):
+        """Display already filtered and sorted hosts."""
+        # Switch views and update models in one paint/layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            cards_mode = self._view_mode == "cards"
+            self._cards_view.setVisible(cards_mode)
+            self._list_container.setVisible(not cards_mode)
+
+            if cards_mode:
+                self._display_as_cards(hosts)
+            else:
+                self._display_as_list(hosts)
+        finally:
+            self.setUpdatesEnabled(True)
 
+    def resizeEvent(self, event):
+        """Schedule a card relayout; the grid only changes when columns do."""
+        super().resizeEvent(event)
         if self._view_mode == "cards":
-            self._display_as_cards(hosts)
-        else:
-            self._display_as_list(hosts)
+            self._resize_timer.start()
+
+    def _card_columns(self) -> int:
+        """Number of card columns that fit in the cards view."""
+        width = self._cards_view.viewport().width() - CARD_SPACING
+        return max(1, width // (CARD_WIDTH + CARD_SPACING))
+
+    def _relayout_cards(self):
+        """Reflow the cards if the column count changed since the last layout."""
+        cols = self._card_columns()
+        if cols != self._current_cols:
+            self._current_cols = cols
+            self._cards_view.doItemsLayout()
 
     def _display_as_cards(self, hosts: list):
-        """Display hosts as cards in a grid."""
-        visible_fields = self._data_manager.get_card_visible_fields()
-
-        # Calculate columns based on width
-        cols = max(1, (self.width() - 32) // 240)
-        if cols < 1:
-            cols = 3
-
-        row = 0
-        col = 0
-
-        for host in hosts:
-            card = HostCard(host, visible_fields=visible_fields)
-            card.connect_requested.connect(self.connect_requested.emit)
-            card.edit_requested.connect(self.edit_requested.emit)
-            card.delete_requested.connect(self.delete_requested.emit)
-            card.winbox_requested.connect(self.winbox_requested.emit)
-            card.web_access_requested.connect(self.web_access_requested.emit)
-            self._hosts_layout.addWidget(card, row, col)
-            self._host_widgets.append(card)
-
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
-
-        # Add "Add Host" card
-        add_card = AddHostCard()
-        add_card.clicked.connect(self.add_requested.emit)
-        self._hosts_layout.addWidget(add_card, row, col)
-        self._host_widgets.append(add_card)
-
-        # Add stretch at the end
-        self._hosts_layout.setRowStretch(row + 1, 1)
+        """Display hosts as cards."""
+        self._card_delegate.set_visible_fields(self._data_manager.get_card_visible_fields())
+        version = self._data_manager.hosts_version()
+        if version != self._card_cache_version:
+            self._card_delegate.invalidate_cache()
+            self._card_cache_version = version
+        self._cards_model.set_hosts(hosts)
+        self._relayout_cards()
 
     def _display_as_list(self, hosts: list):
-        """Display hosts as a table using QTableWidget."""
-        visible_fields = self._data_manager.get_list_visible_fields()
-        column_widths = self._data_manager.get_list_column_widths()
-
-        # Reset layout for table view
-        self._hosts_layout.setSpacing(0)
-        self._hosts_layout.setContentsMargins(0, 0, 0, 0)
-        self._hosts_layout.setColumnStretch(0, 1)
-
-        # Create table widget
-        self._table_widget = HostsTableWidget(
-            visible_fields=visible_fields,
-            column_widths=column_widths
+        """Display hosts as a table using HostsTableView."""
+        self._table_widget.set_visible_fields(
+            self._data_manager.get_list_visible_fields(),
+            self._data_manager.get_list_column_widths()
         )
         self._table_widget.set_hosts(hosts)
-
-        # Connect signals
-        self._table_widget.connect_requested.connect(self.connect_requested.emit)
-        self._table_widget.edit_requested.connect(self.edit_requested.emit)
-        self._table_widget.delete_requested.connect(self.delete_requested.emit)
-        self._table_widget.winbox_requested.connect(self.winbox_requested.emit)
-        self._table_widget.web_access_requested.connect(self.web_access_requested.emit)
-        self._table_widget.column_width_changed.connect(self._on_column_resized)
-
-        self._hosts_layout.addWidget(self._table_widget, 0, 0, 1, -1)
-        self._host_widgets.append(self._table_widget)
-
-        # Add "Add Host" button at the end
-        add_btn = QPushButton("+ Adicionar Host")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 16px;
-                color: #888888;
-                font-size: 13px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #2d2d2d;
-                color: #007acc;
-            }
-        """)
-        add_btn.clicked.connect(self.add_requested.emit)
-        self._hosts_layout.addWidget(add_btn, 1, 0, 1, -1)
-        self._host_widgets.append(add_btn)
-
-        # Add stretch
-        self._hosts_layout.setRowStretch(2, 1)
-
-    def resizeEvent(self, event):
-        """Handle resize to recalculate grid columns."""
-        super().resizeEvent(event)
-        if self._view_mode == "cards":
-            self.refresh()
@@ -14,21 +14,22 @@ import asyncio
 import logging
 import subprocess
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QMessageBox, QStatusBar, QSplitter, QMenu, QFrame, QToolBar, QSizePolicy,
     QLineEdit, QDialog, QTabWidget, QToolButton, QStackedWidget, QFileDialog
 )
-from PySide6.QtCore import Qt, Slot, Signal, QTimer, QSize, QStandardPaths
+from PySide6.QtCore import Qt, Slot, Signal, QThread, QTimer, QSize, QStandardPaths
 from PySide6.QtGui import QCloseEvent, QAction, QIcon
 
 from core.ssh_session import SSHSession, SSHConfig
 from core.agent import UsageStats
 from core.data_manager import get_data_manager, DataManager
-from gui.terminal_widget import TerminalWidget
+from gui.terminal_widget import TerminalWidget, SCROLLBACK_LINES
 from gui.chat_widget import ChatWidget
 from gui.file_browser import FileBrowser
 from gui.hosts_dialog import HostDialog, PasswordPromptDialog, QuickConnectDialog
@@ -47,8 +48,84 @@ from gui.managers.chat_coordinator import ChatCoordinator
 from gui.managers.sftp_coordinator import SFTPCoordinator
 from gui.managers.layout_manager import LayoutManager
 
+# Manufacturers whose web interface supports auto-login
+_AUTOLOGIN_MANUFACTURERS = frozenset(("MikroTik", "Zabbix", "Proxmox"))
+
+# Web auto-login is optional (needs requests; selenium itself is imported per call)
+try:
+    from core.web_autologin import autologin_mikrotik, autologin_zabbix, autologin_proxmox
+    _AUTOLOGIN_AVAILABLE = True
+    _AUTOLOGIN_HANDLERS = {
+        "MikroTik": autologin_mikrotik,
+        "Zabbix": autologin_zabbix,
+        "Proxmox": autologin_proxmox,
+    }
+except ImportError:
+    _AUTOLOGIN_AVAILABLE = False
+    _AUTOLOGIN_HANDLERS = {}
+
 logger = logging.getLogger(__name__)
 
+# SSH output flush delay bounds (ms); the delay grows while flushes carry
+# more than _OUTPUT_BURST_CHARS and shrinks back for interactive output
+_OUTPUT_FLUSH_MIN_MS = 4
+_OUTPUT_FLUSH_MAX_MS = 25
+_OUTPUT_BURST_CHARS = 64 * 1024
+
+# Output of background tabs is held until the tab is shown, up to this many chars
+_HIDDEN_OUTPUT_MAX_CHARS = 1024 * 1024
+
+# Runaway output (e.g. `yes`) is cut to the lines the scrollback can hold before
+# it reaches pyte, which scrolls line by line; only checked above this size
+_OUTPUT_TRUNCATE_MIN_CHARS = 64 * 1024
+_OUTPUT_TRUNCATED_MARKER = "\r\n[... saída truncada ...]\r\n"
+
+# Window resizes are sent to the remote PTY once they settle for this long (ms)
+_RESIZE_DEBOUNCE_MS = 150
+
+
+# Terminal tabs stylesheet
+_TABS_STYLE = """
+    QTabWidget::pane { border: none; background-color: #1e1e1e; }
+    QTabBar::tab {
+        background-color: #2d2d2d; color: #969696;
+        padding: 8px 16px; margin-right: 2px;
+        border-top-left-radius: 4px; border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected { background-color: #1e1e1e; color: #ffffff; }
+    QTabBar::tab:hover:!selected { background-color: #3c3c3c; }
+"""
+
+# Main toolbar stylesheet
+_TOOLBAR_STYLE = """
+    QToolBar {
+        background-color: #252526; border: none;
+        border-bottom: 1px solid #3c3c3c; padding: 4px; spacing: 4px;
+    }
+    QToolButton {
+        background-color: transparent; border: none; border-radius: 4px;
+        padding: 6px 12px; color: #dcdcdc; font-size: 12px;
+    }
+    QToolButton:hover { background-color: #3c3c3c; }
+    QToolButton:pressed, QToolButton:checked { background-color: #094771; }
+"""
+
+def _truncate_output(text: str) -> str:
+    """Keep only the last SCROLLBACK_LINES lines of text; older ones would scroll out anyway."""
+    cut = len(text)
+    for _ in range(SCROLLBACK_LINES):
+        cut = text.rfind('\n', 0, cut)
+        if cut < 0:
+            return text
+    # Resume right after a newline so no escape sequence is cut in half
+    return _OUTPUT_TRUNCATED_MARKER + text[cut + 1:]
+
+
+@lru_cache(maxsize=None)
+def _downloads_dir() -> str:
+    """Get the user's downloads folder, looked up once per process."""
+    return QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DownloadLocation)
+
 
 class MainWindow(QMainWindow):
     """Main application window with hosts view, terminal tabs, and chat."""
@@ -66,6 +143,8 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon(str(logo_path)))
 
         self._resize_timer: Optional[QTimer] = None
+        # Winbox path already found on disk; cleared when settings change or launch fails
+        self._verified_winbox_path: Optional[str] = None
 
         # Initialize data manager and handle setup/unlock
         self._data_manager = get_data_manager()
@@ -78,19 +157,43 @@ class MainWindow(QMainWindow):
         self._output_timer = QTimer()
         self._output_timer.setSingleShot(True)
         self._output_timer.timeout.connect(self._flush_output_buffer)
+        # Ids of sessions with buffered output, so a flush skips idle tabs
+        self._dirty_sessions: Set[str] = set()
+        # Buffered output size per session id, to bound what background tabs hold
+        self._pending_output_chars: Dict[str, int] = {}
+        self._flush_interval_ms = 10
+
+        # Throttles SFTP progress/status messages to one status bar update per 50 ms
+        self._status_timer = QTimer()
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._show_pending_status)
+        self._pending_status: Optional[Tuple[str, int]] = None
+
+        # Coalesces _update_ui_state calls made during one event loop pass
+        self._ui_state_timer = QTimer()
+        self._ui_state_timer.setSingleShot(True)
+        self._ui_state_timer.setInterval(0)
+        self._ui_state_timer.timeout.connect(self._do_update_ui_state)
+
+        # Set while closeEvent waits for _close_all_tabs_async
+        self._closing = False
+        self._close_ready = False
 
         self._setup_ui()
         self._setup_managers()
         self._setup_connections()
 
-        # Create first empty tab
-        self._session_manager.create_session()
+        # Create first empty tab; the hosts view refreshes once for all of it
+        with self._hosts_view.batch_refresh():
+            self._session_manager.create_session()
 
-        self._update_ui_state()
-        self._refresh_hosts_list()
+            self._do_update_ui_state()
+            self._refresh_hosts_list()
 
-        # Start maximized
-        self.showMaximized()
+        # Start maximized; only sets the state, so the window is laid out once when
+        # main() shows it instead of here before the event loop runs
+        self.setWindowState(self.windowState() | Qt.WindowState.WindowMaximized)
 
     def _handle_startup(self) -> bool:
         """Handle application startup - setup or unlock as needed."""
@@ -185,16 +288,7 @@ class MainWindow(QMainWindow):
         self._tab_widget.setTabsClosable(False)
         self._tab_widget.setMovable(True)
         self._tab_widget.setDocumentMode(True)
-        self._tab_widget.setStyleSheet("""
-            QTabWidget::pane { border: none; background-color: #1e1e1e; }
-            QTabBar::tab {
-                background-color: #2d2d2d; color: #969696;
-                padding: 8px 16px; margin-right: 2px;
-                border-top-left-radius: 4px; border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected { background-color: #1e1e1e; color: #ffffff; }
-            QTabBar::tab:hover:!selected { background-color: #3c3c3c; }
-        """)
+        self._tab_widget.setStyleSheet(_TABS_STYLE)
 
         # Chat panel
         self._chat_panel = QFrame()
@@ -211,8 +305,8 @@ class MainWindow(QMainWindow):
         sftp_layout = QVBoxLayout(self._sftp_panel)
         sftp_layout.setContentsMargins(0, 0, 0, 0)
         sftp_layout.setSpacing(0)
-        self._sftp_browser = FileBrowser()
-        sftp_layout.addWidget(self._sftp_browser)
+        # FileBrowser is built on the first toggle (see _ensure_sftp_browser)
+        self._sftp_browser: Optional[FileBrowser] = None
 
         self._stacked_widget.addWidget(self._terminal_area)
 
@@ -221,13 +315,12 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Desconectado")
 
-        # Apply dark theme
-        self._apply_dark_theme()
-
     def _setup_managers(self) -> None:
         """Initialize and configure managers."""
         # Session Manager
         self._session_manager = SessionManager(self._tab_widget, self)
+        # SessionManager's live id -> session dict, read directly on the SSH output path
+        self._sessions = self._session_manager.sessions
         self._session_manager.set_terminal_callbacks(
             on_input=self._on_terminal_input_for_session,
             on_reconnect=self._on_reconnect_for_session,
@@ -240,18 +333,15 @@ class MainWindow(QMainWindow):
         self._connection_manager = ConnectionManager(self)
         self._connection_manager.set_callbacks(
             on_ssh_output=self._on_ssh_output_for_session,
-            on_unexpected_disconnect=lambda sid: self._unexpected_disconnect.emit(sid)
+            on_unexpected_disconnect=lambda sid: self._unexpected_disconnect.emit(sid),
+            on_flush_output=self._flush_session_output
         )
 
         # Chat Coordinator
         self._chat_coordinator = ChatCoordinator(self._chat, self._data_manager, self)
 
         # SFTP Coordinator
-        self._sftp_coordinator = SFTPCoordinator(self._sftp_browser, self)
-        self._sftp_browser.download_requested.connect(self._on_sftp_download_requested)
-        self._sftp_browser.upload_requested.connect(self._on_sftp_upload_requested)
-        self._sftp_browser.status_message.connect(lambda msg: self._status_bar.showMessage(msg, 3000))
-        self._sftp_browser.directory_changed.connect(self._on_sftp_directory_changed)
+        self._sftp_coordinator = SFTPCoordinator(parent=self)
 
         # Layout Manager
         self._layout_manager = LayoutManager(
@@ -270,18 +360,7 @@ class MainWindow(QMainWindow):
         toolbar = QToolBar()
         toolbar.setMovable(False)
         toolbar.setIconSize(QSize(20, 20))
-        toolbar.setStyleSheet("""
-            QToolBar {
-                background-color: #252526; border: none;
-                border-bottom: 1px solid #3c3c3c; padding: 4px; spacing: 4px;
-            }
-            QToolButton {
-                background-color: transparent; border: none; border-radius: 4px;
-                padding: 6px 12px; color: #dcdcdc; font-size: 12px;
-            }
-            QToolButton:hover { background-color: #3c3c3c; }
-            QToolButton:pressed, QToolButton:checked { background-color: #094771; }
-        """)
+        toolbar.setStyleSheet(_TOOLBAR_STYLE)
 
         # Hosts button
         self._hosts_btn = QAction("Hosts", self)
@@ -351,40 +430,6 @@ class MainWindow(QMainWindow):
 
         return toolbar
 
-    def _apply_dark_theme(self) -> None:
-        """Apply dark theme to the window."""
-        self.setStyleSheet("""
-            QMainWindow { background-color: #1e1e1e; }
-            QWidget { background-color: #1e1e1e; color: #dcdcdc; }
-            QGroupBox {
-                background-color: #252526; border: 1px solid #3c3c3c;
-                border-radius: 4px; margin-top: 8px; padding: 12px; padding-top: 24px;
-                font-weight: bold;
-            }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; color: #dcdcdc; }
-            QLineEdit, QSpinBox {
-                background-color: #3c3c3c; border: 1px solid #555555;
-                border-radius: 3px; padding: 4px 8px; color: #dcdcdc;
-            }
-            QLineEdit:focus, QSpinBox:focus { border: 1px solid #007acc; }
-            QPushButton {
-                background-color: #0e639c; border: none; border-radius: 3px;
-                padding: 6px 12px; color: white;
-            }
-            QPushButton:hover { background-color: #1177bb; }
-            QPushButton:pressed { background-color: #0d5a8c; }
-            QPushButton:disabled { background-color: #555555; color: #888888; }
-            QStatusBar { background-color: #007acc; color: white; }
-            QSplitter::handle { background-color: #3c3c3c; height: 3px; }
-            QSplitter::handle:hover { background-color: #007acc; }
-            QMenu {
-                background-color: #3c3c3c; border: 1px solid #555555;
-                border-radius: 4px; padding: 4px;
-            }
-            QMenu::item { padding: 6px 24px; border-radius: 2px; }
-            QMenu::item:selected { background-color: #094771; }
-        """)
-
     def _setup_connections(self) -> None:
         """Connect signals to slots."""
         # SSH output signal
@@ -402,6 +447,7 @@ class MainWindow(QMainWindow):
         # Setup resize timer
         self._resize_timer = QTimer()
         self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(_RESIZE_DEBOUNCE_MS)
         self._resize_timer.timeout.connect(self._on_resize_timeout)
 
         # Keyboard shortcuts
@@ -498,6 +544,8 @@ class MainWindow(QMainWindow):
 
         if session:
             self._chat_coordinator.restore_chat_for_session(session)
+            # Output held while the tab was in the background
+            self._flush_session_output(session)
             if session.terminal:
                 session.terminal.set_focus()
 
@@ -521,25 +569,24 @@ class MainWindow(QMainWindow):
         if not session.terminal:
             return
 
+        # Apply a pending UI update now so it cannot overwrite the "Conectando" status
+        if self._ui_state_timer.isActive():
+            self._ui_state_timer.stop()
+            self._do_update_ui_state()
+
         self._quick_connect_btn.setEnabled(False)
         session.connection_status = "connecting"
         self._session_manager.update_tab_status(session)
         self._status_bar.showMessage(f"Conectando a {config.host}...")
-        self._status_bar.setStyleSheet("background-color: #ca5010; color: white;")
-
-        # Port knocking
-        if session.port_knocking:
-            await self._connection_manager.perform_port_knock(config.host, session.port_knocking)
+        self._set_status_bar_state("connecting")
 
         success = await self._connection_manager.connect(session, config)
 
         if success:
             self._connection_manager.create_agent_for_session(
                 session,
-                on_thinking=lambda status: self._chat.set_status(status),
-                on_usage_update=lambda stats: self._chat.update_cost(
-                    stats.total_cost, stats.prompt_tokens, stats.completion_tokens
-                )
+                on_thinking=self._on_agent_thinking,
+                on_usage_update=self._on_agent_usage
             )
             self._session_manager.update_tab_status(session)
             self._chat_coordinator.restore_chat_for_session(session)
@@ -561,6 +608,25 @@ class MainWindow(QMainWindow):
         self._session_manager.remove_session(session, index)
         self._update_ui_state()
 
+    async def _close_all_tabs_async(self) -> None:
+        """Disconnect every session and remove all tabs, then close the window."""
+        # All sessions close concurrently; shutdown waits for the slowest, not the sum
+        agent_task = self._chat_coordinator.agent_task
+        results = await asyncio.gather(
+            *(self._connection_manager.disconnect(s, agent_task)
+              for s in list(self._sessions.values()) if s.is_connected),
+            self._sftp_coordinator.disconnect(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error disconnecting session on close: {result}")
+
+        # remove_all_sessions removes tabs from the highest index down
+        self._session_manager.remove_all_sessions()
+        self._close_ready = True
+        self.close()
+
     async def _disconnect_session_async(self, session: TabSession) -> None:
         """Async disconnection handler."""
         active_session = self._session_manager.get_active_session()
@@ -577,12 +643,16 @@ class MainWindow(QMainWindow):
 
     def _on_ssh_output_for_session(self, session: TabSession, data: str) -> None:
         """Handle output received from SSH session."""
-        self._ssh_output_received.emit(session.id, data)
+        # asyncssh runs on the qasync loop in the GUI thread: skip the signal dispatch
+        if QThread.currentThread() == self.thread():
+            self._on_ssh_output_slot(session.id, data)
+        else:
+            self._ssh_output_received.emit(session.id, data)
 
     @Slot(str, str)
     def _on_ssh_output_slot(self, tab_id: str, data: str) -> None:
         """Buffer SSH output and process in batches."""
-        session = self._session_manager.get_session(tab_id)
+        session = self._sessions.get(tab_id)
         if not session or not session.terminal:
             return
 
@@ -590,21 +660,54 @@ class MainWindow(QMainWindow):
             return
 
         session.output_buffer.append(data)
+        self._pending_output_chars[tab_id] = self._pending_output_chars.get(tab_id, 0) + len(data)
+        self._dirty_sessions.add(tab_id)
         if not self._output_timer.isActive():
-            self._output_timer.start(10)
+            self._output_timer.start(self._flush_interval_ms)
 
     def _flush_output_buffer(self) -> None:
-        """Flush buffered output to all terminals."""
-        for session in self._session_manager.sessions.values():
-            if not session.output_buffer or not session.terminal:
+        """
+        Flush buffered output to the terminals that received any.
+
+        Background tabs keep their output buffered (their terminal is not
+        fed or laid out) until they are shown or the buffer grows too large.
+        """
+        dirty, self._dirty_sessions = self._dirty_sessions, set()
+        sessions = self._sessions
+        active = self._session_manager.get_active_session()
+        total = 0
+        for tab_id in dirty:
+            session = sessions.get(tab_id)
+            if not session:
+                self._pending_output_chars.pop(tab_id, None)
                 continue
-            if session.terminal._disconnected_mode:
-                session.output_buffer.clear()
+            if (session is not active
+                    and self._pending_output_chars.get(tab_id, 0) < _HIDDEN_OUTPUT_MAX_CHARS):
                 continue
-            combined = ''.join(session.output_buffer)
+            total += self._flush_session_output(session)
+
+        # Bulk output (e.g. cat of a large file) is flushed less often
+        if total > _OUTPUT_BURST_CHARS:
+            self._flush_interval_ms = min(_OUTPUT_FLUSH_MAX_MS, self._flush_interval_ms + 2)
+        else:
+            self._flush_interval_ms = max(_OUTPUT_FLUSH_MIN_MS, self._flush_interval_ms - 2)
+
+    def _flush_session_output(self, session: TabSession) -> int:
+        """Feed a session's buffered output to its terminal and return its length."""
+        self._pending_output_chars.pop(session.id, None)
+        if not session.output_buffer or not session.terminal:
+            return 0
+        if session.terminal._disconnected_mode:
             session.output_buffer.clear()
-            if combined:
-                session.terminal.append_output(combined)
+            return 0
+        combined = ''.join(session.output_buffer)
+        session.output_buffer.clear()
+        size = len(combined)
+        if size > _OUTPUT_TRUNCATE_MIN_CHARS:
+            combined = _truncate_output(combined)
+        if combined:
+            session.terminal.append_output(combined)
+        return size
 
     @Slot(str)
     def _on_unexpected_disconnect(self, tab_id: str) -> None:
@@ -613,6 +716,8 @@ class MainWindow(QMainWindow):
         if not session:
             return
 
+        # Show what a background tab received before the connection dropped
+        self._flush_session_output(session)
         self._connection_manager.handle_unexpected_disconnect(session, self._chat_coordinator.agent_task)
 
         self._output_timer.stop()
@@ -632,6 +737,14 @@ class MainWindow(QMainWindow):
         session = self._session_manager.get_active_session()
         self._chat_coordinator.start_message_processing(session, message, web_search)
 
+    def _on_agent_thinking(self, status: str) -> None:
+        """Show the agent's progress in the chat status line."""
+        self._chat.set_status(status)
+
+    def _on_agent_usage(self, stats: UsageStats) -> None:
+        """Show the agent's token usage and cost in the chat."""
+        self._chat.update_cost(stats.total_cost, stats.prompt_tokens, stats.completion_tokens)
+
     @Slot()
     def _on_stop_agent(self) -> None:
         """Handle stop button click in chat."""
@@ -652,14 +765,30 @@ class MainWindow(QMainWindow):
 
     # === SFTP Handlers ===
 
+    def _throttled_status(self, message: str, timeout: int = 0) -> None:
+        """Show a status message at most every 50 ms; the latest skipped one is shown next."""
+        if self._status_timer.isActive():
+            self._pending_status = (message, timeout)
+            return
+        self._status_bar.showMessage(message, timeout)
+        self._status_timer.start()
+
+    def _show_pending_status(self) -> None:
+        """Show the last status message held back by the throttle."""
+        if self._pending_status is None:
+            return
+        message, timeout = self._pending_status
+        self._pending_status = None
+        self._status_bar.showMessage(message, timeout)
+        self._status_timer.start()
+
     @Slot(list)
     def _on_sftp_download_requested(self, files) -> None:
         """Handle download request from SFTP browser."""
         if not files:
             return
 
-        downloads_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DownloadLocation)
-        dest_dir = QFileDialog.getExistingDirectory(self, "Selecionar pasta de destino", downloads_dir)
+        dest_dir = QFileDialog.getExistingDirectory(self, "Selecionar pasta de destino", _downloads_dir())
 
         if not dest_dir:
             return
@@ -670,8 +799,10 @@ class MainWindow(QMainWindow):
         """Download files to local directory."""
         downloaded = await self._sftp_coordinator.download_files(
             files, dest_dir,
-            progress_callback=lambda msg: self._status_bar.showMessage(msg)
+            progress_callback=self._throttled_status
         )
+        # Show the last held-back message now so it cannot replace the summary below
+        self._show_pending_status()
         if downloaded > 0:
             self._status_bar.showMessage(f"{downloaded} arquivo(s) baixado(s)", 3000)
 
@@ -684,11 +815,18 @@ class MainWindow(QMainWindow):
         """Upload files to remote directory."""
         uploaded = await self._sftp_coordinator.upload_files(
             local_files, remote_dir,
-            progress_callback=lambda msg: self._status_bar.showMessage(msg)
+            progress_callback=self._throttled_status
         )
+        # Show the last held-back message now so it cannot replace the summary below
+        self._show_pending_status()
         if uploaded > 0:
             self._status_bar.showMessage(f"{uploaded} arquivo(s) enviado(s)", 3000)
 
+    @Slot(str)
+    def _on_sftp_status_message(self, message: str) -> None:
+        """Show a file browser message on the status bar for 3 seconds."""
+        self._throttled_status(message, 3000)
+
     @Slot(str)
     def _on_sftp_directory_changed(self, path: str) -> None:
         """Handle SFTP directory change."""
@@ -699,6 +837,10 @@ class MainWindow(QMainWindow):
     # === UI State and Navigation ===
 
     def _update_ui_state(self) -> None:
+        """Schedule a UI state update; calls made in one event loop pass apply once."""
+        self._ui_state_timer.start()
+
+    def _do_update_ui_state(self) -> None:
         """Update UI based on active tab connection state."""
         session = self._session_manager.get_active_session()
         connected = session is not None and session.is_connected
@@ -712,14 +854,22 @@ class MainWindow(QMainWindow):
         if connected and session and session.config:
             host = session.config.host
             self._status_bar.showMessage(f"Conectado a {host}")
-            self._status_bar.setStyleSheet("background-color: #107c10; color: white;")
+            self._set_status_bar_state("connected")
             self._show_terminal_view()
         else:
             self._status_bar.showMessage("Desconectado")
-            self._status_bar.setStyleSheet("background-color: #007acc; color: white;")
+            self._set_status_bar_state("disconnected")
             if not any_connected:
                 self._show_hosts_view()
 
+    def _set_status_bar_state(self, state: str) -> None:
+        """Color the status bar for a connection state (rules in gui/theme.py)."""
+        # A dynamic property only re-polishes; setStyleSheet would re-parse CSS
+        if self._status_bar.property("connection") != state:
+            self._status_bar.setProperty("connection", state)
+            self._status_bar.style().unpolish(self._status_bar)
+            self._status_bar.style().polish(self._status_bar)
+
     def _show_hosts_view(self) -> None:
         """Show the hosts view."""
         self._stacked_widget.setCurrentIndex(0)
@@ -742,9 +892,23 @@ class MainWindow(QMainWindow):
         if visible:
             self._chat.focus_input()
 
+    def _ensure_sftp_browser(self) -> None:
+        """Create the SFTP file browser the first time its panel is shown."""
+        if self._sftp_browser is not None:
+            return
+        self._sftp_browser = FileBrowser()
+        self._sftp_panel.layout().addWidget(self._sftp_browser)
+        self._sftp_browser.download_requested.connect(self._on_sftp_download_requested)
+        self._sftp_browser.upload_requested.connect(self._on_sftp_upload_requested)
+        self._sftp_browser.status_message.connect(self._on_sftp_status_message)
+        self._sftp_browser.directory_changed.connect(self._on_sftp_directory_changed)
+        self._sftp_coordinator.set_browser(self._sftp_browser)
+
     @Slot()
     def _on_toggle_sftp(self) -> None:
         """Toggle SFTP panel visibility."""
+        if not self._layout_manager.sftp_visible:
+            self._ensure_sftp_browser()
         visible = self._layout_manager.toggle_sftp()
         self._sftp_coordinator.visible = visible
 
@@ -894,9 +1058,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Winbox", "Caminho do Winbox nao configurado.\nConfigure em Configuracoes > Winbox.")
             return
 
-        if not Path(winbox_path).exists():
-            QMessageBox.warning(self, "Winbox", f"Executavel nao encontrado:\n{winbox_path}")
-            return
+        if winbox_path != self._verified_winbox_path:
+            if not Path(winbox_path).exists():
+                QMessageBox.warning(self, "Winbox", f"Executavel nao encontrado:\n{winbox_path}")
+                return
+            self._verified_winbox_path = winbox_path
 
         host = self._data_manager.get_host_by_id(host_id)
         if not host:
@@ -907,10 +1073,11 @@ class MainWindow(QMainWindow):
         password = self._data_manager.get_password(host_id)
 
         if host.port_knocking:
-            asyncio.create_task(self._connection_manager.perform_port_knock(target_ip, host.port_knocking))
-            QTimer.singleShot(500, lambda: self._execute_winbox(
-                winbox_path, target_ip, winbox_port, host.username, password or ""
-            ))
+            # Launch as soon as the knock sequence has been sent, not after a fixed delay
+            async def knock_and_launch():
+                await self._connection_manager.perform_port_knock(target_ip, host.port_knocking)
+                self._execute_winbox(winbox_path, target_ip, winbox_port, host.username, password or "")
+            asyncio.ensure_future(knock_and_launch())
         else:
             self._execute_winbox(winbox_path, target_ip, winbox_port, host.username, password or "")
 
@@ -929,6 +1096,7 @@ class MainWindow(QMainWindow):
             subprocess.Popen(args, creationflags=subprocess.DETACHED_PROCESS)
             self._status_bar.showMessage(f"Winbox iniciado para {host_port}", 3000)
         except Exception as e:
+            self._verified_winbox_path = None
             logger.error(f"Failed to launch Winbox: {e}")
             QMessageBox.critical(self, "Erro", f"Erro ao iniciar Winbox:\n{e}")
 
@@ -955,14 +1123,16 @@ class MainWindow(QMainWindow):
 
         web_password = self._data_manager.get_web_password(host)
         should_autologin = (
-            host.manufacturer in ["MikroTik", "Zabbix", "Proxmox"] and
+            host.manufacturer in _AUTOLOGIN_MANUFACTURERS and
             host.web_username and
             web_password
         )
 
         if host.port_knocking:
-            asyncio.create_task(self._connection_manager.perform_port_knock(target_ip, host.port_knocking))
-            QTimer.singleShot(500, lambda: self._execute_web_access(url, host, should_autologin, web_password))
+            async def knock_and_open():
+                await self._connection_manager.perform_port_knock(target_ip, host.port_knocking)
+                self._execute_web_access(url, host, should_autologin, web_password)
+            asyncio.ensure_future(knock_and_open())
         else:
             self._execute_web_access(url, host, should_autologin, web_password)
 
@@ -970,26 +1140,23 @@ class MainWindow(QMainWindow):
         """Open URL in default browser, with optional auto-login."""
         try:
             if should_autologin and host and web_password:
-                self._status_bar.showMessage(f"Auto-login em {host.manufacturer}...", 5000)
-                try:
-                    from core.web_autologin import autologin_mikrotik, autologin_zabbix, autologin_proxmox
-
-                    if host.manufacturer == "MikroTik":
-                        autologin_mikrotik(url, host.web_username, web_password)
-                    elif host.manufacturer == "Zabbix":
-                        autologin_zabbix(url, host.web_username, web_password)
-                    elif host.manufacturer == "Proxmox":
-                        autologin_proxmox(url, host.web_username, web_password)
-
-                    self._status_bar.showMessage(f"Auto-login concluído: {url}", 3000)
-                    return
-
-                except ImportError as e:
-                    logger.warning(f"Selenium not installed: {e}")
+                autologin = _AUTOLOGIN_HANDLERS.get(host.manufacturer)
+                if not _AUTOLOGIN_AVAILABLE:
+                    logger.warning("Web auto-login dependencies not installed")
                     self._status_bar.showMessage("Selenium não instalado, abrindo navegador normal", 3000)
-                except Exception as e:
-                    logger.error(f"Auto-login failed: {e}")
-                    QMessageBox.warning(self, "Aviso", f"Erro no auto-login:\n{e}")
+                elif autologin:
+                    self._status_bar.showMessage(f"Auto-login em {host.manufacturer}...", 5000)
+                    try:
+                        autologin(url, host.web_username, web_password)
+                        self._status_bar.showMessage(f"Auto-login concluído: {url}", 3000)
+                        return
+
+                    except ImportError as e:
+                        logger.warning(f"Selenium not installed: {e}")
+                        self._status_bar.showMessage("Selenium não instalado, abrindo navegador normal", 3000)
+                    except Exception as e:
+                        logger.error(f"Auto-login failed: {e}")
+                        QMessageBox.warning(self, "Aviso", f"Erro no auto-login:\n{e}")
 
             webbrowser.open(url)
             self._status_bar.showMessage(f"Abrindo navegador: {url}", 3000)
@@ -1006,6 +1173,7 @@ class MainWindow(QMainWindow):
         dialog = SettingsDialog(parent=self)
         result = dialog.exec()
         if result == QDialog.DialogCode.Accepted:
+            self._verified_winbox_path = None
             new_chat_pos = self._data_manager.get_chat_position()
             new_sftp_pos = self._data_manager.get_sftp_position()
             self._layout_manager.apply_settings_changes(new_chat_pos, new_sftp_pos)
@@ -1059,25 +1227,29 @@ class MainWindow(QMainWindow):
         """Handle window resize."""
         super().resizeEvent(event)
         if self._resize_timer:
-            self._resize_timer.start(200)
+            self._resize_timer.start()
 
     @Slot()
     def _on_resize_timeout(self) -> None:
         """Handle resize timeout."""
         session = self._session_manager.get_active_session()
         if session and session.ssh_session and session.ssh_session.is_connected and session.terminal:
-            cols, rows = session.terminal.get_terminal_size()
-            asyncio.ensure_future(session.ssh_session.resize_terminal(cols, rows))
+            size = session.terminal.get_terminal_size()
+            # Window manager snaps often re-fire resizes with the same size
+            if size == session.last_sent_size:
+                return
+            session.last_sent_size = size
+            asyncio.ensure_future(session.ssh_session.resize_terminal(*size))
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle window close."""
-        connected_sessions = self._session_manager.get_connected_sessions()
-        if connected_sessions:
-            async def disconnect_all():
-                for session in connected_sessions:
-                    await self._disconnect_session_async(session)
-            asyncio.ensure_future(disconnect_all())
-            QTimer.singleShot(100, self.close)
-            event.ignore()
-        else:
+        if self._close_ready or not self._session_manager.has_connected_sessions():
+            self._hosts_view.stop_filter_workers()
             event.accept()
+            return
+
+        # Close again once every session is disconnected
+        if not self._closing:
+            self._closing = True
+            asyncio.ensure_future(self._close_all_tabs_async())
+        event.ignore()
@@ -18,6 +18,9 @@ from gui.tab_session import TabSession
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for each TCP knock; the SYN is what matters, not the handshake
+_KNOCK_TIMEOUT = 0.1
+
 
 class ConnectionManager(QObject):
     """
@@ -46,6 +49,7 @@ class ConnectionManager(QObject):
         self._on_command_executed: Optional[Callable] = None
         self._on_thinking: Optional[Callable] = None
         self._on_usage_update: Optional[Callable] = None
+        self._on_flush_output: Optional[Callable] = None
 
     def set_callbacks(
         self,
@@ -53,7 +57,8 @@ class ConnectionManager(QObject):
         on_unexpected_disconnect: Callable,
         on_command_executed: Callable = None,
         on_thinking: Callable = None,
-        on_usage_update: Callable = None
+        on_usage_update: Callable = None,
+        on_flush_output: Callable = None
     ) -> None:
         """Set callbacks for connection events."""
         self._on_ssh_output = on_ssh_output
@@ -61,26 +66,39 @@ class ConnectionManager(QObject):
         self._on_command_executed = on_command_executed
         self._on_thinking = on_thinking
         self._on_usage_update = on_usage_update
+        self._on_flush_output = on_flush_output
 
     async def perform_port_knock(self, host: str, sequence: List[dict]) -> None:
         """Execute port knocking sequence (fire and forget)."""
+        loop = asyncio.get_running_loop()
+        try:
+            # Resolve once, without blocking the GUI thread
+            infos = await loop.getaddrinfo(host, None, family=socket.AF_INET)
+            address = infos[0][4][0]
+        except Exception:
+            return  # Fire and forget - ignore all errors
+
+        # Knocks stay sequential: the order of the ports is the secret
         for entry in sequence:
             try:
                 protocol = entry.get("protocol", "tcp")
                 port = entry.get("port")
                 if not port:
                     continue
-                sock_type = socket.SOCK_STREAM if protocol == "tcp" else socket.SOCK_DGRAM
-                sock = socket.socket(socket.AF_INET, sock_type)
-                sock.settimeout(0.1)
                 if protocol == "tcp":
                     try:
-                        sock.connect((host, port))
-                    except (socket.timeout, ConnectionRefusedError, OSError):
+                        _, writer = await asyncio.wait_for(
+                            asyncio.open_connection(address, port), _KNOCK_TIMEOUT
+                        )
+                        writer.close()
+                    except (asyncio.TimeoutError, ConnectionRefusedError, OSError):
                         pass
                 else:
-                    sock.sendto(b"", (host, port))
-                sock.close()
+                    # asyncio transports drop empty datagrams; a non-blocking sendto
+                    # to a resolved address does not block
+                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                        sock.setblocking(False)
+                        sock.sendto(b"", (address, port))
             except Exception:
                 pass  # Fire and forget - ignore all errors
         logger.debug(f"Port knocking completed for {host}: {sequence}")
@@ -121,6 +139,9 @@ class ConnectionManager(QObject):
             return text.replace("\n", "\r\n")
 
         def cmd_callback(cmd: str, output: str) -> None:
+            # Output still held for a background tab was received before this command
+            if self._on_flush_output:
+                self._on_flush_output(session)
             # Ensure injected command lines respect carriage return
             if session.terminal:
                 session.terminal.append_output(f"\r\n$ {cmd}\r\n")
@@ -193,6 +214,7 @@ class ConnectionManager(QObject):
             # Send terminal size after connection
             cols, rows = session.terminal.get_terminal_size()
             await session.ssh_session.resize_terminal(cols, rows)
+            session.last_sent_size = (cols, rows)
 
             self.connection_success.emit(session)
             return True
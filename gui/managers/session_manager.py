@@ -5,10 +5,10 @@ Extracted from main_window.py for better separation of concerns.
 
 import asyncio
 import logging
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, Callable, Set
 
 from PySide6.QtWidgets import QTabWidget, QTabBar, QLabel, QMessageBox
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QTimer
 from PySide6.QtGui import QColor, QPainter, QPixmap, QIcon
 
 from gui.tab_session import TabSession
@@ -40,6 +40,13 @@ class SessionManager(QObject):
         self._status_icons = {}
         self._create_status_icons()
 
+        # Sessions whose tab text/icon must be refreshed; applied once per event loop pass
+        self._dirty_tabs: Set[str] = set()
+        self._tab_status_timer = QTimer(self)
+        self._tab_status_timer.setSingleShot(True)
+        self._tab_status_timer.setInterval(0)
+        self._tab_status_timer.timeout.connect(self._apply_tab_statuses)
+
         # Callbacks for terminal signals (set by MainWindow)
         self._on_terminal_input: Optional[Callable] = None
         self._on_reconnect: Optional[Callable] = None
@@ -189,20 +196,31 @@ class SessionManager(QObject):
         return close_btn
 
     def update_tab_status(self, session: TabSession) -> None:
-        """Update tab icon and title for a session."""
-        if not session.terminal:
-            return
-
-        # Find tab index
-        for i in range(self._tab_widget.count()):
-            if self._tab_widget.widget(i) is session.terminal:
-                self._tab_widget.setTabText(i, session.display_name)
-                # Only show icon when connecting or connected (not disconnected)
-                if session.connection_status == "disconnected":
-                    self._tab_widget.setTabIcon(i, QIcon())  # Empty icon
-                else:
-                    self._tab_widget.setTabIcon(i, self._status_icons[session.connection_status])
-                break
+        """Schedule a tab icon and title update; several calls in one event loop pass apply once."""
+        self._dirty_tabs.add(session.id)
+        if not self._tab_status_timer.isActive():
+            self._tab_status_timer.start()
+
+    def _apply_tab_statuses(self) -> None:
+        """Update tab icon and title of every session marked by update_tab_status."""
+        dirty, self._dirty_tabs = self._dirty_tabs, set()
+        for session_id in dirty:
+            session = self._sessions.get(session_id)
+            if not session or not session.terminal:
+                continue
+
+            i = self._tab_widget.indexOf(session.terminal)
+            if i < 0:
+                continue
+            # setTabText relayouts the tab bar even when the text is unchanged
+            title = session.display_name
+            if self._tab_widget.tabText(i) != title:
+                self._tab_widget.setTabText(i, title)
+            # Only show icon when connecting or connected (not disconnected)
+            if session.connection_status == "disconnected":
+                self._tab_widget.setTabIcon(i, QIcon())  # Empty icon
+            else:
+                self._tab_widget.setTabIcon(i, self._status_icons[session.connection_status])
 
     def remove_session(self, session: TabSession, index: int) -> None:
         """Remove a tab from the widget and cleanup."""
@@ -221,6 +239,22 @@ class SessionManager(QObject):
         if self._tab_widget.count() == 0:
             self.create_session()
 
+    def remove_all_sessions(self) -> None:
+        """Remove every tab without recreating an empty one (used on shutdown)."""
+        by_terminal = {id(s.terminal): s for s in self._sessions.values()}
+        # Signals blocked so currentChanged does not fire once per removed tab
+        self._tab_widget.blockSignals(True)
+        try:
+            # Highest index first, so removals never shift the remaining tabs
+            for index in range(self._tab_widget.count() - 1, -1, -1):
+                session = by_terminal.get(id(self._tab_widget.widget(index)))
+                self._tab_widget.removeTab(index)
+                if session:
+                    del self._sessions[session.id]
+                    self.session_removed.emit(session.id)
+        finally:
+            self._tab_widget.blockSignals(False)
+
     def _on_tab_close_requested(self, index: int) -> None:
         """Handle tab close request. Returns session to close or None if cancelled."""
         widget = self._tab_widget.widget(index)
@@ -32,13 +32,19 @@ class SFTPCoordinator(QObject):
     status_message = Signal(str)
     directory_changed = Signal(str)
 
-    def __init__(self, sftp_browser: FileBrowser, parent=None):
+    def __init__(self, sftp_browser: Optional[FileBrowser] = None, parent=None):
         super().__init__(parent)
-        self._sftp_browser = sftp_browser
+        # Created by MainWindow the first time the SFTP panel is shown
+        self._sftp_browser: Optional[FileBrowser] = None
         self._sftp_sync_timer: Optional[QTimer] = None
         self._visible = False
 
-        # Connect browser signals
+        if sftp_browser:
+            self.set_browser(sftp_browser)
+
+    def set_browser(self, sftp_browser: FileBrowser) -> None:
+        """Attach the file browser once it has been created."""
+        self._sftp_browser = sftp_browser
         self._sftp_browser.directory_changed.connect(self._on_directory_changed)
 
     @property
@@ -54,15 +60,17 @@ class SFTPCoordinator(QObject):
     @property
     def follow_terminal(self) -> bool:
         """Check if follow terminal mode is enabled."""
-        return self._sftp_browser.follow_terminal
+        return bool(self._sftp_browser) and self._sftp_browser.follow_terminal
 
     @property
     def current_path(self) -> str:
         """Get current SFTP path."""
-        return self._sftp_browser.current_path
+        return self._sftp_browser.current_path if self._sftp_browser else ""
 
     async def connect_for_session(self, session: TabSession) -> bool:
         """Connect SFTP browser to the session's SSH connection."""
+        if not self._sftp_browser:
+            return False
         if not session.ssh_session or not session.ssh_session.is_connected:
             return False
 
@@ -84,16 +92,19 @@ class SFTPCoordinator(QObject):
 
     async def disconnect(self) -> None:
         """Disconnect SFTP browser."""
+        if not self._sftp_browser:
+            return
         await self._sftp_browser.disconnect()
         self._sftp_browser.clear()
 
     def clear(self) -> None:
         """Clear SFTP browser."""
-        self._sftp_browser.clear()
+        if self._sftp_browser:
+            self._sftp_browser.clear()
 
     async def sync_with_terminal_cwd(self, session: TabSession) -> None:
         """Sync SFTP browser with terminal's current working directory."""
-        if not self._visible:
+        if not self._visible or not self._sftp_browser:
             logger.debug("SFTP sync skipped: panel not visible")
             return
         if not self._sftp_browser.follow_terminal:
@@ -223,7 +234,7 @@ class SFTPCoordinator(QObject):
 
     def _trigger_path_update(self, path: str) -> None:
         """Update SFTP browser to the given path if follow mode is enabled."""
-        if not self._visible:
+        if not self._visible or not self._sftp_browser:
             return
         if not self._sftp_browser.follow_terminal:
             return
@@ -52,6 +52,8 @@ class TabSession:
     # Fallback hosts for connection retry
     fallback_hosts: List[str] = field(default_factory=list)
     current_host_index: int = 0
+    # Last (cols, rows) sent to the remote PTY, to skip no-op resizes
+    last_sent_size: Optional[Tuple[int, int]] = None
     # SFTP state
     sftp_current_path: str = "~"
     sftp_history: List[str] = field(default_factory=list)
@@ -81,4 +83,5 @@ class TabSession:
         self.ssh_session = None
         self.agent = None
         self.connection_status = "disconnected"
+        self.last_sent_size = None
         self.output_buffer.clear()
@@ -0,0 +1,47 @@
+"""
+Application-wide dark theme.
+Installed once on the QApplication so every window and dialog inherits it.
+"""
+
+from PySide6.QtWidgets import QApplication
+
+
+# Dark theme stylesheet; widgets only set local overrides on top of it
+_DARK_THEME_STYLE = """
+    QMainWindow { background-color: #1e1e1e; }
+    QWidget { background-color: #1e1e1e; color: #dcdcdc; }
+    QGroupBox {
+        background-color: #252526; border: 1px solid #3c3c3c;
+        border-radius: 4px; margin-top: 8px; padding: 12px; padding-top: 24px;
+        font-weight: bold;
+    }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; color: #dcdcdc; }
+    QLineEdit, QSpinBox {
+        background-color: #3c3c3c; border: 1px solid #555555;
+        border-radius: 3px; padding: 4px 8px; color: #dcdcdc;
+    }
+    QLineEdit:focus, QSpinBox:focus { border: 1px solid #007acc; }
+    QPushButton {
+        background-color: #0e639c; border: none; border-radius: 3px;
+        padding: 6px 12px; color: white;
+    }
+    QPushButton:hover { background-color: #1177bb; }
+    QPushButton:pressed { background-color: #0d5a8c; }
+    QPushButton:disabled { background-color: #555555; color: #888888; }
+    QStatusBar { background-color: #007acc; color: white; }
+    QStatusBar[connection="connecting"] { background-color: #ca5010; }
+    QStatusBar[connection="connected"] { background-color: #107c10; }
+    QSplitter::handle { background-color: #3c3c3c; height: 3px; }
+    QSplitter::handle:hover { background-color: #007acc; }
+    QMenu {
+        background-color: #3c3c3c; border: 1px solid #555555;
+        border-radius: 4px; padding: 4px;
+    }
+    QMenu::item { padding: 6px 24px; border-radius: 2px; }
+    QMenu::item:selected { background-color: #094771; }
+"""
+
+
+def install_theme(app: QApplication) -> None:
+    """Apply the dark theme stylesheet to the whole application."""
+    app.setStyleSheet(_DARK_THEME_STYLE)
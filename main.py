@@ -24,6 +24,7 @@ import qasync
 
 from gui.main_window import MainWindow
 from gui.splash import SplashScreen
+from gui.theme import install_theme
 from core.resources import get_resource_path
 
 
@@ -78,6 +79,9 @@ def main() -> int:
     # Enable high DPI scaling
     app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
 
+    # Dark theme for every window, parsed once
+    install_theme(app)
+
     # Show splash screen
     splash = SplashScreen()
     splash.show()